@@ -4,29 +4,37 @@ from __future__ import annotations
 
 import argparse
 import os
+import re
 import sys
 from pathlib import Path
 
 import psycopg
-from dotenv import load_dotenv
 
 from .db import cleaner as db_cleaner
 from .db import mark_commonness as db_commonness
 from .llm import define_enricher as llm_define_enricher
+from .utils.env_loader import load_env_file
 from .wikitionary.downloader import DEFAULT_WIKTIONARY_URL, download_wiktionary_dump
 from .wikitionary.extract import extract_wiktionary_dump
 from .wikitionary.filter import filter_languages
 from .wikitionary import pre_process as wiktionary_pre_process
 from .wikitionary.pipeline import run_pipeline
 from .wikitionary.transform import (
+    PARTITION_WORKERS,
     JsonlProcessingError,
     copy_jsonl_to_postgres,
     partition_dictionary_by_language,
+    validate_jsonl,
 )
 
 
 DEFAULT_DICTIONARY_TABLE = "dictionary_en"
 
+_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_QUALIFIED_IDENTIFIER_RE = re.compile(
+    r"^[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)?$"
+)
+
 
 COMMAND_NAMES = {
     "download",
@@ -42,6 +50,27 @@ COMMAND_NAMES = {
 }
 
 
+def _lang_code(value: str) -> str:
+    code = value.strip()
+    if not code:
+        raise argparse.ArgumentTypeError("language codes cannot be empty")
+    return code
+
+
+def _sql_identifier(value: str) -> str:
+    if not _IDENTIFIER_RE.match(value):
+        raise argparse.ArgumentTypeError(f"{value!r} is not a valid SQL identifier")
+    return value
+
+
+def _qualified_sql_identifier(value: str) -> str:
+    if not _QUALIFIED_IDENTIFIER_RE.match(value):
+        raise argparse.ArgumentTypeError(
+            f"{value!r} is not a valid table name (expected name or schema.name)"
+        )
+    return value
+
+
 def _add_database_options(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--env-file",
@@ -58,7 +87,7 @@ def _add_database_options(parser: argparse.ArgumentParser) -> None:
 def _get_conninfo(args: argparse.Namespace) -> str:
     env_file = getattr(args, "env_file", None)
     if env_file:
-        load_dotenv(env_file)
+        load_env_file(env_file)
 
     var_name = getattr(args, "database_url_var", "DATABASE_URL")
     if not var_name:
@@ -112,6 +141,9 @@ def _cmd_load(args: argparse.Namespace) -> int:
         args._parser.error(str(exc))
 
     try:
+        if args.validate:
+            validated = validate_jsonl(args.input)
+            print(f"Validated {validated} JSON rows in {args.input}")
         rows_copied = copy_jsonl_to_postgres(
             jsonl_path=args.input,
             conninfo=conninfo,  # type: ignore[arg-type]
@@ -143,6 +175,7 @@ def _cmd_partition(args: argparse.Namespace) -> int:
             table_prefix=args.prefix,
             target_schema=args.target_schema,
             drop_existing=args.drop_existing,
+            max_workers=args.workers,
         )
     except (psycopg.Error, ValueError) as exc:
         args._parser.error(f"Database error: {exc}")
@@ -179,6 +212,7 @@ def _cmd_pipeline(args: argparse.Namespace) -> int:
             table_prefix=args.prefix,
             target_schema=args.target_schema,
             drop_existing_partitions=args.drop_existing_partitions,
+            fused=args.fused,
         )
     except (FileNotFoundError, JsonlProcessingError) as exc:
         args._parser.error(str(exc))
@@ -274,6 +308,7 @@ def _cmd_llm_define(args: argparse.Namespace) -> int:
         progress_every_rows=args.progress_every_rows,
         progress_every_seconds=args.progress_every_seconds,
         recompute_existing=args.recompute_existing,
+        cache_path=args.cache_path,
     )
     return 0
 
@@ -293,6 +328,7 @@ def _cmd_pre_process(args: argparse.Namespace) -> int:
         progress_every_rows=args.progress_every_rows,
         progress_every_seconds=args.progress_every_seconds,
         recompute_existing=args.recompute_existing,
+        workers=args.workers,
     )
     return 0
 
@@ -368,6 +404,14 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Truncate the destination table before inserting new rows.",
     )
+    load_parser.add_argument(
+        "--validate",
+        action="store_true",
+        help=(
+            "Parse every line before loading so malformed JSON is reported "
+            "before the table is touched (PostgreSQL still validates during COPY)."
+        ),
+    )
     _add_database_options(load_parser)
     load_parser.set_defaults(func=_cmd_load, _parser=load_parser)
 
@@ -404,6 +448,12 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Drop and recreate each language table before inserting rows.",
     )
+    partition_parser.add_argument(
+        "--workers",
+        type=int,
+        default=PARTITION_WORKERS,
+        help="Languages partitioned concurrently, one connection each (default: %(default)s).",
+    )
     _add_database_options(partition_parser)
     partition_parser.set_defaults(func=_cmd_partition, _parser=partition_parser)
 
@@ -437,6 +487,14 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Truncate the destination table before inserting new rows.",
     )
+    pipeline_parser.add_argument(
+        "--fused",
+        action="store_true",
+        help=(
+            "Stream download → decompress → COPY in one pass without writing "
+            "the archive or JSONL file to disk."
+        ),
+    )
     pipeline_parser.add_argument(
         "--skip-download",
         action="store_true",
@@ -491,16 +549,19 @@ def _build_parser() -> argparse.ArgumentParser:
     filter_parser.add_argument(
         "languages",
         nargs="+",
+        type=_lang_code,
         help="Language codes to materialize (e.g. en zh fr, or 'all').",
     )
     filter_parser.add_argument(
         "--table",
         default="dictionary_all",
+        type=_qualified_sql_identifier,
         help="Source table containing the raw entries (default: dictionary_all).",
     )
     filter_parser.add_argument(
         "--column",
         default="data",
+        type=_sql_identifier,
         help="JSONB column storing the dictionary payloads (default: data).",
     )
     filter_parser.add_argument(
@@ -573,6 +634,12 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Regenerate payloads even if the target column is already populated.",
     )
+    pre_process_parser.add_argument(
+        "--workers",
+        type=int,
+        default=wiktionary_pre_process.DEFAULT_WORKERS,
+        help="Worker processes used to normalize payloads; 1 runs in-process (default: CPU count).",
+    )
     _add_database_options(pre_process_parser)
     pre_process_parser.set_defaults(func=_cmd_pre_process, _parser=pre_process_parser)
 
@@ -724,6 +791,10 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Recreate target-column payloads even if already populated.",
     )
+    llm_define_parser.add_argument(
+        "--cache-path",
+        help="SQLite file caching LLM responses so re-runs skip answered requests.",
+    )
     _add_database_options(llm_define_parser)
     llm_define_parser.set_defaults(func=_cmd_llm_define, _parser=llm_define_parser)
 
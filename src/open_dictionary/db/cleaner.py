@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import time
+from functools import lru_cache
 from typing import Any, Sequence
 
 from psycopg import sql
@@ -136,8 +137,17 @@ def _flush_deletions(
     if not ids:
         return 0
 
-    values_sql = sql.SQL(", ").join(sql.SQL("(%s::bigint)") for _ in ids)
-    delete_sql = sql.SQL(
+    delete_sql = _compose_delete_sql(table_name, len(ids))
+    cursor.execute(delete_sql, ids)
+    return cursor.rowcount
+
+
+@lru_cache(maxsize=4)
+def _compose_delete_sql(table_name: str, row_count: int) -> sql.Composed:
+    # Only full batches and the trailing one occur, so the statement is
+    # composed once per size instead of on every flush.
+    values_sql = sql.SQL(", ".join(["(%s::bigint)"] * row_count))
+    return sql.SQL(
         """
         DELETE FROM {table} AS t
         USING (VALUES {values}) AS v(id)
@@ -148,9 +158,6 @@ def _flush_deletions(
         values=values_sql,
     )
 
-    cursor.execute(delete_sql, ids)
-    return cursor.rowcount
-
 
 def _report_progress(processed: int, deleted: int, start_time: float) -> None:
     elapsed = max(time.monotonic() - start_time, 1e-6)
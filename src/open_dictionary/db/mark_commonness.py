@@ -17,6 +17,8 @@ UPDATE_BATCH_SIZE = 5000
 PROGRESS_EVERY_ROWS = 20_000
 PROGRESS_EVERY_SECONDS = 30.0
 
+_STAGING_TABLE = "common_score_updates"
+
 
 def enrich_common_score(
     table_name: str,
@@ -56,6 +58,9 @@ def enrich_common_score(
 
     with data_access.get_connection() as update_conn:
         with update_conn.cursor() as cursor:
+            _create_staging_table(cursor)
+            update_conn.commit()
+
             last_log_time = start_time
             for row in data_access.iterate_table(
                 table_name,
@@ -187,32 +192,51 @@ def _cached_zipf_frequency(word: str) -> float:
     return float(zipf_frequency(word, "en"))
 
 
+def _create_staging_table(cursor: Cursor[Any]) -> None:
+    cursor.execute(
+        sql.SQL(
+            """
+            CREATE TEMP TABLE IF NOT EXISTS {staging} (
+                id BIGINT PRIMARY KEY,
+                score DOUBLE PRECISION
+            ) ON COMMIT DELETE ROWS
+            """
+        ).format(staging=sql.Identifier(_STAGING_TABLE))
+    )
+
+
 def _flush_updates(
     cursor: Cursor[Any],
     table_name: str,
     payloads: Sequence[tuple[int, Optional[float]]],
 ) -> int:
+    """COPY ``payloads`` into a staging table, then apply them in one UPDATE.
+
+    The staging table is ``ON COMMIT DELETE ROWS``, so the caller's commit
+    after each flush leaves it empty for the next batch.
+    """
     if not payloads:
         return 0
-    values_sql = sql.SQL(", ").join(
-        sql.SQL("(%s::bigint, %s::double precision)") for _ in payloads
+
+    copy_sql = sql.SQL("COPY {staging} (id, score) FROM STDIN").format(
+        staging=sql.Identifier(_STAGING_TABLE)
     )
+    with cursor.copy(copy_sql) as copy:
+        for row_id, score in payloads:
+            copy.write_row((row_id, score))
+
     update_sql = sql.SQL(
         """
         UPDATE {table} AS t
-        SET common_score = v.score
-        FROM (VALUES {values}) AS v(id, score)
-        WHERE t.id = v.id
+        SET common_score = s.score
+        FROM {staging} AS s
+        WHERE t.id = s.id
         """
     ).format(
         table=sql.Identifier(table_name),
-        values=values_sql,
+        staging=sql.Identifier(_STAGING_TABLE),
     )
-    params: list[Any] = []
-    for row_id, score in payloads:
-        params.extend((row_id, score))
-
-    cursor.execute(update_sql, params)
+    cursor.execute(update_sql)
     return len(payloads)
 
 
@@ -1,8 +1,35 @@
 import sqlite3
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Iterator
-import json
+
+import orjson
+
+
+# Applied once per connection. WAL with synchronous=NORMAL only fsyncs on
+# checkpoints instead of on every commit; the remaining settings keep temp
+# structures and hot pages in memory.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=10737418240",
+    "PRAGMA busy_timeout=5000",
+)
+
+# Batches written between explicit passive WAL checkpoints.
+CHECKPOINT_EVERY_BATCHES = 100
+
+
+def _encode_definition(definition: dict[str, Any] | str) -> str:
+    # Pre-serialized JSON (e.g. from ``BaseModel.model_dump_json``) is stored
+    # as-is. orjson emits UTF-8 without escaping non-ASCII, matching the
+    # previous json.dumps(..., ensure_ascii=False) output.
+    if isinstance(definition, str):
+        return definition
+    return orjson.dumps(definition).decode("utf-8")
 
 
 class SQLiteManager:
@@ -11,23 +38,35 @@ class SQLiteManager:
     def __init__(self, db_path: str = "data/dictionary.sqlite"):
         """Initialize SQLite manager.
 
+        A single connection is opened here and reused for every operation
+        until :meth:`close`; access is serialized with a lock so it can be
+        shared between threads.
+
         Args:
             db_path: Path to SQLite database file
         """
         path_str = str(db_path)
-        self._use_memory_db = path_str == ":memory:"
-        self._memory_connection: sqlite3.Connection | None = None
 
-        if self._use_memory_db:
-            # Keep a persistent connection open for in-memory databases so the schema
-            # and rows survive multiple operations.
+        if path_str == ":memory:":
             self.db_path = path_str
-            self._memory_connection = sqlite3.connect(path_str, check_same_thread=False)
         else:
             self.db_path = Path(path_str)
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Autocommit mode: transactions are opened explicitly where needed.
+        self._conn: sqlite3.Connection | None = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._lock = threading.Lock()
+        self._batches_since_checkpoint = 0
+        for pragma in _CONNECTION_PRAGMAS:
+            self._conn.execute(pragma)
+
         self._init_db()
+        with self._connection() as conn:
+            self._row_count = conn.execute("SELECT COUNT(*) FROM definitions").fetchone()[0]
 
     def _init_db(self):
         """Initialize database schema."""
@@ -38,47 +77,100 @@ class SQLiteManager:
                     definition JSON NOT NULL
                 )
             """)
-            conn.commit()
 
     @contextmanager
     def _connection(self) -> Iterator[sqlite3.Connection]:
-        """Yield a SQLite connection, keeping in-memory DBs alive."""
-        if self._use_memory_db:
-            assert self._memory_connection is not None
-            yield self._memory_connection
-        else:
-            conn = sqlite3.connect(self.db_path)
+        """Yield the shared connection while holding the lock."""
+        if self._conn is None:
+            raise RuntimeError("SQLiteManager is closed")
+        with self._lock:
+            yield self._conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the block inside ``BEGIN IMMEDIATE`` ... ``COMMIT``."""
+        with self._connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
             try:
                 yield conn
-            finally:
-                conn.close()
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
 
-    def insert_definition(self, word: str, definition: dict[str, Any]):
+    def insert_definition(self, word: str, definition: dict[str, Any] | str):
         """Insert a single definition into the database.
 
         Args:
             word: The word being defined
-            definition: The definition data as a dictionary
+            definition: The definition data as a dictionary or JSON text
         """
-        with self._connection() as conn:
+        payload = _encode_definition(definition)
+        with self._transaction() as conn:
+            new_rows = self._count_new_words(conn, [word])
             conn.execute(
                 "INSERT OR REPLACE INTO definitions (word, definition) VALUES (?, ?)",
-                (word, json.dumps(definition, ensure_ascii=False))
+                (word, payload)
             )
-            conn.commit()
+            self._row_count += new_rows
 
-    def insert_definitions_batch(self, definitions: list[tuple[str, dict[str, Any]]]):
+    def insert_definitions_batch(
+        self,
+        definitions: list[tuple[str, dict[str, Any]]] | list[tuple[str, str]],
+        *,
+        replace: bool = True,
+    ):
         """Insert multiple definitions in a batch.
 
+        Rows are serialized before the connection lock is taken, then written
+        with one prepared ``executemany`` inside a single transaction.
+
         Args:
-            definitions: List of (word, definition_dict) tuples
+            definitions: List of (word, definition) tuples; each definition is
+                a dictionary or already-serialized JSON text
+            replace: Overwrite words that are already stored. When False,
+                existing words are left untouched (``INSERT OR IGNORE``), so
+                duplicates cost a primary-key lookup and no row write
         """
+        rows = [(word, _encode_definition(defn)) for word, defn in definitions]
+        with self._transaction() as conn:
+            if replace:
+                new_rows = self._count_new_words(conn, [word for word, _ in rows])
+                conn.executemany(
+                    "INSERT OR REPLACE INTO definitions (word, definition) VALUES (?, ?)",
+                    rows
+                )
+            else:
+                cursor = conn.executemany(
+                    "INSERT OR IGNORE INTO definitions (word, definition) VALUES (?, ?)",
+                    rows
+                )
+                # Ignored rows are not counted as changes.
+                new_rows = cursor.rowcount
+            self._row_count += new_rows
+
+            self._batches_since_checkpoint += 1
+            checkpoint = self._batches_since_checkpoint >= CHECKPOINT_EVERY_BATCHES
+            if checkpoint:
+                self._batches_since_checkpoint = 0
+
+        if checkpoint:
+            self.checkpoint()
+
+    @staticmethod
+    def _count_new_words(conn: sqlite3.Connection, words: list[str]) -> int:
+        """Number of distinct ``words`` not stored yet (primary-key probes only)."""
+        distinct = list(dict.fromkeys(words))
+        existing = conn.execute(
+            "SELECT COUNT(*) FROM definitions WHERE word IN (SELECT value FROM json_each(?))",
+            (orjson.dumps(distinct).decode("utf-8"),),
+        ).fetchone()[0]
+        return len(distinct) - existing
+
+    def checkpoint(self) -> None:
+        """Copy WAL content back into the database file without blocking readers."""
         with self._connection() as conn:
-            conn.executemany(
-                "INSERT OR REPLACE INTO definitions (word, definition) VALUES (?, ?)",
-                [(word, json.dumps(defn, ensure_ascii=False)) for word, defn in definitions]
-            )
-            conn.commit()
+            conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
 
     def get_definition(self, word: str) -> dict[str, Any] | None:
         """Get definition for a word.
@@ -95,7 +187,12 @@ class SQLiteManager:
                 (word,)
             )
             row = cursor.fetchone()
-            return json.loads(row[0]) if row else None
+            return orjson.loads(row[0]) if row else None
+
+    def load_words(self) -> set[str]:
+        """Return every word that already has a stored definition."""
+        with self._connection() as conn:
+            return {word for (word,) in conn.execute("SELECT word FROM definitions")}
 
     def count_definitions(self) -> int:
         """Count total definitions in database.
@@ -107,11 +204,21 @@ class SQLiteManager:
             cursor = conn.execute("SELECT COUNT(*) FROM definitions")
             return cursor.fetchone()[0]
 
+    def cached_count(self) -> int:
+        """Row count tracked in-process since construction.
+
+        Counted once at startup and updated on every insert, so it is cheap
+        enough to log after each batch. Only writes made through this manager
+        are reflected; use :meth:`count_definitions` for an authoritative
+        figure.
+        """
+        return self._row_count
+
     def close(self) -> None:
-        """Close any persistent SQLite connections."""
-        if self._memory_connection is not None:
-            self._memory_connection.close()
-            self._memory_connection = None
+        """Close the shared SQLite connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
     def __del__(self):  # pragma: no cover - best effort cleanup
         try:
@@ -1,7 +1,22 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, ConfigDict
+from typing import Any, Optional
 import json
-from open_dictionary.llm.llm_client import get_chat_response
+from openai import AsyncOpenAI
+from open_dictionary.llm.llm_client import (
+    get_chat_response,
+    get_chat_response_async,
+)
+from open_dictionary.llm.rate_limit import AsyncRateLimiter
+from open_dictionary.llm.response_cache import ResponseCache, cache_key
+from open_dictionary.utils.env_loader import get_env
+
+# Bump whenever the instruction or output schema changes so responses cached
+# for an older prompt are no longer reused.
+INSTRUCTION_VERSION = "1"
+
+# Requests sharing the same instruction preamble are routed to the same
+# provider prompt cache, so the preamble is billed at the cached-token rate.
+PROMPT_CACHE_KEY = f"open-dictionary-define-v{INSTRUCTION_VERSION}"
 
 
 instruction = """
@@ -40,136 +55,36 @@ instruction = """
 
 ---
 
-**【示例 1】**
-
-**输入JSON:**
-`{"word": "run", "pos": "verb", "forms": [{"form": "runs", "tags": ["present", "singular", "third-person"]}, {"form": "running", "tags": ["participle", "present"]}, {"form": "ran", "tags": ["past"]}, {"form": "run", "tags": ["participle", "past"]}], "senses": [{"glosses": ["To move swiftly on foot, so that both feet leave the ground during each stride."]}, {"glosses": ["To manage, be in charge of (a business, campaign, etc.)."]}], "sounds": [{"ipa": "/rʌn/", "ogg_url": "url"}], "derived": [{"word": "runner"}, {"word": "runway"}], "etymology_text": "From Middle English ronnen, rennen, from Old English rinnan, iernan (“to run, flow”), and Old Norse rinna (“to run, flow”), both from Proto-Germanic *rinnaną (“to run, flow”)."}`
-
-**你的JSON输出:**
-{
-  "word": "run",
-  "pos": "verb",
-  "pronunciations": {
-    "ipa": "/rʌn/",
-    "natural_phonics": "run",
-    "ogg_url": "url"
-  },
-  "forms": [
-    "runs (第三人称单数现在时)",
-    "running (现在分词)",
-    "ran (过去式)",
-    "run (过去分词)"
-  ],
-  "concise_definition": "跑，奔跑；经营，管理。",
-  "detailed_definitions": [
-    {
-      "definition_en": "To move swiftly on foot, so that both feet leave the ground during each stride.",
-      "definition_cn": "指人或动物快速奔跑的动作，强调速度快、双脚交替离地的状态。",
-      "example": {
-        "en": "I run three miles in the park every morning.",
-        "cn": "我每天早上在公园里跑三英里。"
-      }
-    },
-    {
-      "definition_en": "To manage, be in charge of (a business, campaign, etc.).",
-      "definition_cn": "指负责管理和运营一个组织、项目或生意，强调的是主导和控制的角色。",
-      "example": {
-        "en": "My friend runs a successful online store.",
-        "cn": "我的朋友经营着一家成功的网店。"
-      }
-    }
-  ],
-  "derived": [
-    {
-      "word": "runner",
-      "definition_cn": "跑步者；赛跑者。"
-    },
-    {
-      "word": "runway",
-      "definition_cn": "（机场的）跑道；（时装秀的）T台。"
-    }
-  ],
-  "etymology": "该词源自中古英语中的 ronnen 和 rennen，更早则来自古英语的 rinnan（意为“奔跑，流动”）和古诺斯语的 rinna（意为“奔跑，流动”）。它们共同源于原始日耳曼语的 *rinnaną，核心含义是“奔跑或流动”。"
-}
-
----
-
-**【示例 2】**
-
-**输入JSON:**
-`{"word": "philosophy", "pos": "noun", "forms": [{"form": "philosophies", "tags": ["plural"]}], "senses": [{"glosses": ["The study of the fundamental nature of knowledge, reality, and existence, especially when considered as an academic discipline."]}, {"glosses": ["A theory or attitude held by a person or organization that acts as a guiding principle for behavior."]}], "sounds": [{"ipa": "/fɪˈlɒsəfi/", "ogg_url": "url"}], "derived": [{"word": "philosopher"}, {"word": "philosophical"}], "etymology_text": "From Middle English philosophie, from Old French philosophie, from Latin philosophia, from Ancient Greek φιλοσοφία (philosophía, “love of wisdom”), from φίλος (phílos, “loving”) + σοφία (sophía, “wisdom”)."}`
-
-**你的JSON输出:**
-{
-  "word": "philosophy",
-  "pos": "noun",
-  "pronunciations": {
-    "ipa": "/fɪˈlɒsəfi/",
-    "natural_phonics": "phi-lo-so-phy",
-    "ogg_url": "url"
-  },
-  "forms": [
-    "philosophies (复数形式)"
-  ],
-  "concise_definition": "哲学；人生观，信条，准则。",
-  "detailed_definitions": [
-    {
-      "definition_en": "The study of the fundamental nature of knowledge, reality, and existence, especially when considered as an academic discipline.",
-      "definition_cn": "作为一门学科，指对知识、真实、存在等根本性问题的探究和思考。",
-      "example": {
-        "en": "She is studying philosophy at a famous university.",
-        "cn": "她在一所著名的大学学习哲学。"
-      }
-    },
-    {
-      "definition_en": "A theory or attitude held by a person or organization that acts as a guiding principle for behavior.",
-      "definition_cn": "指个人或组织所信奉的一套行事准则或人生观，是指导其决策和行为的根本理念。",
-      "example": {
-        "en": "My personal philosophy is to treat everyone with respect.",
-        "cn": "我个人的人生信条是尊重每一个人。"
-      }
-    }
-  ],
-  "derived": [
-    {
-      "word": "philosopher",
-      "definition_cn": "哲学家，思想家。"
-    },
-    {
-      "word": "philosophical",
-      "definition_cn": "哲学的，富有哲理的。"
-    }
-  ],
-  "etymology": "该词源自古希腊语的 φιλοσοφία (philosophía)，由 φίλος (phílos，意为“爱”) 和 σοφία (sophía，意为“智慧”) 组成，字面意思即“对智慧的热爱”。它通过拉丁语的 philosophia 和古法语的 philosophie 最终进入中古英语，并演变为现代形式。"
-}
+"""
 
----
+class _StrictModel(BaseModel):
+    # Structured outputs in strict mode reject schemas that allow extra keys.
+    model_config = ConfigDict(extra="forbid")
 
-"""
 
-class Example(BaseModel):
+class Example(_StrictModel):
     en: str
     cn: str
 
 
-class DetailedDefinition(BaseModel):
+class DetailedDefinition(_StrictModel):
     definition_en: str
     definition_cn: str
     example: Example
 
 
-class DerivedWord(BaseModel):
+class DerivedWord(_StrictModel):
     word: str
     definition_cn: str
 
 
-class Pronunciations(BaseModel):
+class Pronunciations(_StrictModel):
     ipa: str
     natural_phonics: str
-    ogg_url: Optional[str] = None
+    ogg_url: Optional[str]
 
 
-class Definition(BaseModel):
+class Definition(_StrictModel):
     word: str
     pos: str
     pronunciations: Pronunciations
@@ -180,16 +95,85 @@ class Definition(BaseModel):
     etymology: str
 
 
-def define(input_json: dict) -> Definition:
+DEFINITION_SCHEMA = Definition.model_json_schema()
+
+
+def define(input_json: dict, *, cache: ResponseCache | None = None) -> Definition:
     """Generate a structured dictionary definition from Wiktionary JSON data.
 
     Args:
         input_json: Dictionary containing Wiktionary data
+        cache: Optional response cache consulted before calling the LLM
 
     Returns:
         Definition object with structured dictionary entry
     """
-    input_data = json.dumps(input_json, ensure_ascii=False)
-    response = get_chat_response(instruction, input_data)
+    input_data = _serialize_input(input_json)
+
+    key = None
+    if cache is not None:
+        key = _cache_key(input_data)
+        cached = cache.get(key)
+        if cached is not None:
+            return Definition.model_validate_json(cached)
+
+    response = get_chat_response(
+        instruction,
+        input_data,
+        json_schema=DEFINITION_SCHEMA,
+        schema_name="Definition",
+        prompt_cache_key=PROMPT_CACHE_KEY,
+    )
+
+    definition = Definition.model_validate_json(response)
+    if cache is not None and key is not None:
+        cache.set(key, response)
+    return definition
+
+
+async def define_async(
+    input_json: dict,
+    *,
+    client: AsyncOpenAI,
+    cache: ResponseCache | None = None,
+    limiter: AsyncRateLimiter | None = None,
+) -> Definition:
+    """Async variant of :func:`define` issuing the request through ``client``.
+
+    When ``limiter`` is given it is acquired before each LLM request (cache
+    hits do not consume capacity).
+    """
+    input_data = _serialize_input(input_json)
+
+    key = None
+    if cache is not None:
+        key = _cache_key(input_data)
+        cached = cache.get(key)
+        if cached is not None:
+            return Definition.model_validate_json(cached)
+
+    if limiter is not None:
+        await limiter.acquire()
+
+    response = await get_chat_response_async(
+        client,
+        instruction,
+        input_data,
+        json_schema=DEFINITION_SCHEMA,
+        schema_name="Definition",
+        prompt_cache_key=PROMPT_CACHE_KEY,
+    )
+
+    definition = Definition.model_validate_json(response)
+    if cache is not None and key is not None:
+        cache.set(key, response)
+    return definition
+
+
+def _serialize_input(value: Any) -> str:
+    # Compact separators: whitespace in the prompt is billed as input tokens.
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
 
-    return Definition.model_validate_json(response)
+def _cache_key(input_data: str) -> str:
+    return cache_key(get_env("LLM_MODEL") or "", INSTRUCTION_VERSION, input_data)
@@ -4,7 +4,10 @@ import concurrent.futures
 import json
 import random
 import time
+from contextlib import closing, nullcontext
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
 from typing import Any, Callable, Sequence
 
 from psycopg import sql
@@ -12,6 +15,7 @@ from psycopg.cursor import Cursor
 
 from open_dictionary.db.access import DatabaseAccess
 from open_dictionary.llm.define import Definition, define
+from open_dictionary.llm.response_cache import ResponseCache
 
 DEFAULT_TABLE_NAME = "dictionary_filtered_en"
 DEFAULT_SOURCE_COLUMN = "data"
@@ -46,8 +50,13 @@ def enrich_definitions(
     progress_every_rows: int = DEFAULT_PROGRESS_EVERY_ROWS,
     progress_every_seconds: float = DEFAULT_PROGRESS_EVERY_SECONDS,
     recompute_existing: bool = False,
+    cache_path: str | None = None,
 ) -> None:
-    """Generate LLM-enriched dictionary entries and store them in a JSONB column."""
+    """Generate LLM-enriched dictionary entries and store them in a JSONB column.
+
+    When ``cache_path`` is set, validated LLM responses are kept in a SQLite
+    cache there so re-runs skip requests that were already answered.
+    """
 
     if llm_batch_size <= 0:
         raise ValueError("llm_batch_size must be positive")
@@ -73,7 +82,7 @@ def enrich_definitions(
         f"fetch_batch={fetch_batch_size} llm_batch={llm_batch_size} "
         f"max_workers={max_workers} retries={max_retries} "
         f"backoff_start={initial_backoff_seconds}s backoff_max={max_backoff_seconds}s "
-        f"recompute_existing={recompute_existing}",
+        f"recompute_existing={recompute_existing} cache={cache_path}",
         flush=True,
     )
 
@@ -108,7 +117,11 @@ def enrich_definitions(
             failed += 1
         emit_progress(force=True)
 
-    with data_access.get_connection() as update_conn:
+    # The cache is closed even when a batch fails, so its connection is not
+    # leaked and the final WAL flush still happens.
+    cache_context = closing(ResponseCache(cache_path)) if cache_path else nullcontext()
+
+    with cache_context as cache, data_access.get_connection() as update_conn:
         with update_conn.cursor() as cursor:
             row_stream = data_access.iterate_table(
                 table_name,
@@ -155,6 +168,7 @@ def enrich_definitions(
                         initial_backoff_seconds,
                         max_backoff_seconds,
                         record_result,
+                        cache,
                     )
                     pending_rows.clear()
                     update_conn.commit()
@@ -170,6 +184,7 @@ def enrich_definitions(
                     initial_backoff_seconds,
                     max_backoff_seconds,
                     record_result,
+                    cache,
                 )
                 pending_rows.clear()
                 update_conn.commit()
@@ -187,6 +202,7 @@ def _process_batch(
     initial_backoff_seconds: float,
     max_backoff_seconds: float,
     record_result: Callable[[bool], None],
+    cache: ResponseCache | None,
 ) -> None:
     successes = _run_llm_batch(
         rows,
@@ -195,6 +211,7 @@ def _process_batch(
         initial_backoff_seconds,
         max_backoff_seconds,
         record_result,
+        cache,
     )
 
     _apply_updates(cursor, table_name, target_column, successes)
@@ -207,6 +224,7 @@ def _run_llm_batch(
     initial_backoff_seconds: float,
     max_backoff_seconds: float,
     record_result: Callable[[bool], None],
+    cache: ResponseCache | None,
 ) -> list[tuple[int, str]]:
     successes: list[tuple[int, str]] = []
 
@@ -220,6 +238,7 @@ def _run_llm_batch(
                 max_retries,
                 initial_backoff_seconds,
                 max_backoff_seconds,
+                cache,
             ): row
             for row in rows
         }
@@ -235,10 +254,7 @@ def _run_llm_batch(
                 )
                 record_result(False)
             else:
-                payload_json = json.dumps(
-                    definition.model_dump(mode="json"),
-                    ensure_ascii=False,
-                )
+                payload_json = definition.model_dump_json()
                 successes.append((row.row_id, payload_json))
                 record_result(True)
 
@@ -250,11 +266,12 @@ def _define_with_retry(
     max_retries: int,
     initial_backoff_seconds: float,
     max_backoff_seconds: float,
+    cache: ResponseCache | None,
 ) -> Definition:
     attempt = 0
     while True:
         try:
-            return define(payload)
+            return define(payload, cache=cache)
         except Exception as exc:  # pragma: no cover - passthrough for runtime errors
             attempt += 1
             if attempt >= max_retries:
@@ -278,11 +295,19 @@ def _apply_updates(
     if not payloads:
         return
 
-    values_sql = sql.SQL(", ").join(
-        sql.SQL("(%s::bigint, %s::text)") for _ in payloads
-    )
+    update_sql = _compose_update_sql(table_name, target_column, len(payloads))
+
+    params = list(chain.from_iterable(payloads))
+    cursor.execute(update_sql, params)
 
-    update_sql = sql.SQL(
+
+@lru_cache(maxsize=8)
+def _compose_update_sql(table_name: str, target_column: str, row_count: int) -> sql.Composed:
+    # Batches only come in a couple of sizes (full and trailing), so the
+    # composed statement is reused instead of rebuilt for every flush.
+    values_sql = sql.SQL(", ".join(["(%s::bigint, %s::text)"] * row_count))
+
+    return sql.SQL(
         """
         UPDATE {table} AS t
         SET {column} = v.payload::jsonb
@@ -295,12 +320,6 @@ def _apply_updates(
         values=values_sql,
     )
 
-    params: list[Any] = []
-    for row_id, payload_json in payloads:
-        params.extend((row_id, payload_json))
-
-    cursor.execute(update_sql, params)
-
 
 def _ensure_target_column(
     data_access: DatabaseAccess,
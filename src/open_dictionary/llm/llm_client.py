@@ -1,18 +1,108 @@
-from openai import OpenAI
+import importlib.util
+from functools import lru_cache
+from typing import Any
+
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
 from open_dictionary.utils.env_loader import get_env
 
-client = OpenAI(
-    # This is the default and can be omitted
-    api_key=get_env('LLM_KEY'),
-    base_url=get_env('LLM_API'),
-)
-
-def get_chat_response(instructions: str, input: str) -> str:
-    response = client.responses.create(
-        model=get_env('LLM_MODEL'), # type: ignore
-        instructions=instructions,
-        input=input,
-        temperature=0.1
+# HTTP/2 lets concurrent requests multiplex over the client's pooled
+# connections instead of opening one TLS connection each. httpx needs the
+# optional ``h2`` package for it (installed with the ``speedups`` extra).
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+@lru_cache(maxsize=1)
+def get_client() -> OpenAI:
+    """Return the shared OpenAI client, creating it on first use.
+
+    Construction is deferred so importing the LLM modules stays free of
+    side effects and does not require the LLM environment to be set.
+    """
+    return OpenAI(
+        api_key=get_env('LLM_KEY'),
+        base_url=get_env('LLM_API'),
+        http_client=DefaultHttpxClient(http2=_HTTP2),
+    )
+
+
+def create_async_client() -> AsyncOpenAI:
+    """Return a new async OpenAI client.
+
+    Async clients hold connections bound to the event loop they were first
+    used on, so callers own the client for the lifetime of a single loop.
+    """
+    return AsyncOpenAI(
+        api_key=get_env('LLM_KEY'),
+        base_url=get_env('LLM_API'),
+        http_client=DefaultAsyncHttpxClient(http2=_HTTP2),
+    )
+
+
+def _build_request(
+    instructions: str,
+    input: str,
+    json_schema: dict[str, Any] | None,
+    schema_name: str,
+    prompt_cache_key: str | None,
+) -> dict[str, Any]:
+    request: dict[str, Any] = {
+        "model": get_env('LLM_MODEL'),
+        "instructions": instructions,
+        "input": input,
+        "temperature": 0.1,
+    }
+    if json_schema is not None:
+        request["text"] = {
+            "format": {
+                "type": "json_schema",
+                "name": schema_name,
+                "schema": json_schema,
+                "strict": True,
+            }
+        }
+    if prompt_cache_key is not None:
+        request["prompt_cache_key"] = prompt_cache_key
+    return request
+
+
+def get_chat_response(
+    instructions: str,
+    input: str,
+    *,
+    json_schema: dict[str, Any] | None = None,
+    schema_name: str = "response",
+    prompt_cache_key: str | None = None,
+) -> str:
+    """Send a single-turn request and return the model's text output.
+
+    When ``json_schema`` is given the request uses structured outputs in strict
+    mode, so the reply is guaranteed to be JSON matching that schema.
+    ``prompt_cache_key`` groups requests that share a long instruction prefix
+    so the provider can serve that prefix from its prompt cache.
+    """
+    response = get_client().responses.create(
+        **_build_request(
+            instructions, input, json_schema, schema_name, prompt_cache_key
+        )
+    )
+
+    return response.output_text
+
+
+async def get_chat_response_async(
+    client: AsyncOpenAI,
+    instructions: str,
+    input: str,
+    *,
+    json_schema: dict[str, Any] | None = None,
+    schema_name: str = "response",
+    prompt_cache_key: str | None = None,
+) -> str:
+    """Async counterpart of :func:`get_chat_response` using ``client``."""
+    response = await client.responses.create(
+        **_build_request(
+            instructions, input, json_schema, schema_name, prompt_cache_key
+        )
     )
 
-    return response.output_text
\ No newline at end of file
+    return response.output_text
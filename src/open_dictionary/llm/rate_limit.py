@@ -0,0 +1,58 @@
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """Token bucket that admits at most ``max_rate`` acquisitions per ``time_period``.
+
+    Requests wait for capacity up front instead of being sent and bounced
+    with HTTP 429, which keeps a large concurrent run just under the
+    provider's rate limit.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        """Create a limiter.
+
+        Args:
+            max_rate: Number of acquisitions allowed per ``time_period``
+            time_period: Window length in seconds (default: one minute)
+        """
+        if max_rate <= 0:
+            raise ValueError("max_rate must be positive")
+        if time_period <= 0:
+            raise ValueError("time_period must be positive")
+
+        self.max_rate = float(max_rate)
+        self.time_period = float(time_period)
+        self._fill_rate = self.max_rate / self.time_period
+        self._tokens = self.max_rate
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until ``amount`` tokens are available and consume them."""
+        amount = min(amount, self.max_rate)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.max_rate,
+                    self._tokens + (now - self._updated) * self._fill_rate,
+                )
+                self._updated = now
+
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+
+                await asyncio.sleep((amount - self._tokens) / self._fill_rate)
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+
+__all__ = ["AsyncRateLimiter"]
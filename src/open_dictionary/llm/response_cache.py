@@ -0,0 +1,73 @@
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+
+
+def cache_key(*parts: str) -> str:
+    """Build a stable cache key from the request components.
+
+    Args:
+        parts: Values that fully determine the LLM request (model, prompt
+            version, input payload, ...)
+
+    Returns:
+        Hex digest identifying the request
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """Persistent SQLite cache of validated LLM responses keyed by request hash."""
+
+    def __init__(self, db_path: str | Path):
+        """Open (or create) the cache database.
+
+        Args:
+            db_path: Path to the SQLite cache file
+        """
+        path = Path(db_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for ``key``, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, response: str) -> None:
+        """Store ``response`` under ``key``."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+                (key, response),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+__all__ = ["ResponseCache", "cache_key"]
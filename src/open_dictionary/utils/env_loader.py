@@ -1,4 +1,6 @@
+from functools import lru_cache
 from os import getenv
+from pathlib import Path
 from dotenv import load_dotenv
 from typing import Literal
 
@@ -6,9 +8,13 @@ load_dotenv()
 
 EnvKey = Literal['LLM_MODEL', 'LLM_KEY', 'LLM_API', 'DATABASE_URL']
 
+@lru_cache(maxsize=None)
 def get_env(key: EnvKey, default: str | None = None) -> str | None:
     """Get environment variable value.
 
+    Lookups are cached; call :func:`load_env_file` rather than
+    ``load_dotenv`` directly so the cache is refreshed.
+
     Args:
         key: Environment variable key
         default: Default value if key not found
@@ -17,3 +23,17 @@ def get_env(key: EnvKey, default: str | None = None) -> str | None:
         Environment variable value or default
     """
     return getenv(key, default)
+
+
+def load_env_file(path: str | Path) -> bool:
+    """Load variables from a .env file and invalidate cached lookups.
+
+    Args:
+        path: Path to the .env file
+
+    Returns:
+        True if at least one variable was set
+    """
+    loaded = load_dotenv(path)
+    get_env.cache_clear()
+    return loaded
@@ -0,0 +1,81 @@
+"""Background prefetching for blocking iterators."""
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_PREFETCH_DEPTH = 4
+
+_DONE = object()
+
+
+class _Failure:
+    __slots__ = ("exc",)
+
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+def prefetch(
+    iterable: Iterable[T],
+    *,
+    depth: int = DEFAULT_PREFETCH_DEPTH,
+    name: str = "prefetch",
+) -> Iterator[T]:
+    """Drain ``iterable`` on a background thread, keeping ``depth`` items ready.
+
+    The source is iterated (and closed) entirely on the producer thread, so a
+    generator holding a database connection never crosses threads. Exceptions
+    from the source are re-raised in the consumer; closing the returned
+    generator early stops the producer.
+    """
+    if depth <= 0:
+        raise ValueError("depth must be positive")
+
+    buffer: queue.Queue[object] = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def _put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        iterator = iter(iterable)
+        try:
+            for item in iterator:
+                if not _put(item):
+                    break
+            else:
+                _put(_DONE)
+        except BaseException as exc:  # re-raised on the consuming thread
+            _put(_Failure(exc))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=_produce, name=name, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.exc
+            yield item  # type: ignore[misc]
+    finally:
+        stop.set()
+        thread.join()
+
+
+__all__ = ["DEFAULT_PREFETCH_DEPTH", "prefetch"]
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import shutil
 import sys
 import urllib.error
 import urllib.request
 from pathlib import Path
+from typing import BinaryIO
 
 from .progress import ByteProgressPrinter
 
@@ -13,12 +15,27 @@ from .progress import ByteProgressPrinter
 DEFAULT_WIKTIONARY_URL = "https://kaikki.org/dictionary/raw-wiktextract-data.jsonl.gz"
 
 
+class _ProgressWriter:
+    """Binary writer wrapper that reports the running byte count."""
+
+    def __init__(self, handle: BinaryIO, progress: ByteProgressPrinter) -> None:
+        self._handle = handle
+        self._progress = progress
+        self.bytes_written = 0
+
+    def write(self, data: bytes) -> int:
+        written = self._handle.write(data)
+        self.bytes_written += written
+        self._progress.report(self.bytes_written)
+        return written
+
+
 def download_wiktionary_dump(
     destination: Path,
     *,
     url: str = DEFAULT_WIKTIONARY_URL,
     overwrite: bool = False,
-    chunk_size: int = 32 * 1024 * 1024,
+    chunk_size: int = 1024 * 1024,
 ) -> Path:
     """Download a Wiktionary dump to ``destination`` with streaming progress."""
 
@@ -32,22 +49,16 @@ def download_wiktionary_dump(
 
     dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-    downloaded = 0
     try:
         with urllib.request.urlopen(url) as response:
             total_size = int(response.headers.get("Content-Length", "0") or 0)
             progress = ByteProgressPrinter("Downloading", total_size)
 
             with dest_path.open("wb") as out_handle:
-                while True:
-                    chunk = response.read(chunk_size)
-                    if not chunk:
-                        break
-                    out_handle.write(chunk)
-                    downloaded += len(chunk)
-                    progress.report(downloaded)
-
-            progress.finalize(downloaded)
+                writer = _ProgressWriter(out_handle, progress)
+                shutil.copyfileobj(response, writer, length=chunk_size)  # type: ignore[arg-type]
+
+            progress.finalize(writer.bytes_written)
 
     except urllib.error.URLError as exc:  # pragma: no cover - network failure guard
         raise RuntimeError(f"Failed to download Wiktionary dump: {exc}") from exc
@@ -24,16 +24,11 @@ def filter_languages(
     if not languages:
         raise ValueError("At least one language code must be provided.")
 
-    normalized: list[str] = []
-    include_all = False
-    for raw_code in languages:
-        code = (raw_code or "").strip()
-        if not code:
-            continue
-        if code.lower() == "all":
-            include_all = True
-            break
-        normalized.append(code)
+    stripped = (code for code in ((raw or "").strip() for raw in languages) if code)
+    # dict.fromkeys dedupes while keeping order, so repeated codes do not
+    # trigger duplicate partition work.
+    normalized = list(dict.fromkeys(stripped))
+    include_all = any(code.lower() == "all" for code in normalized)
 
     language_list: Sequence[str] | None
     if include_all:
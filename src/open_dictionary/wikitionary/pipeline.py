@@ -2,13 +2,131 @@
 
 from __future__ import annotations
 
+import io
+import queue
 import sys
+import threading
+import urllib.error
 import urllib.parse
+import urllib.request
 from pathlib import Path
+from typing import BinaryIO
 
 from .downloader import DEFAULT_WIKTIONARY_URL, download_wiktionary_dump
-from .extract import extract_wiktionary_dump
-from .transform import copy_jsonl_to_postgres, partition_dictionary_by_language
+from .extract import GzipFile, extract_wiktionary_dump
+from .transform import (
+    copy_jsonl_to_postgres,
+    copy_stream_to_postgres,
+    partition_dictionary_by_language,
+)
+
+
+PREFETCH_CHUNK_SIZE = 1024 * 1024
+PREFETCH_DEPTH = 16
+
+
+class _PrefetchingReader(io.RawIOBase):
+    """Raw stream adapter that reads ``handle`` ahead on a background thread.
+
+    Network reads then overlap with decompression and COPY on the consuming
+    thread. ``bytes_read`` counts the compressed bytes handed to the consumer.
+    """
+
+    def __init__(
+        self,
+        handle: BinaryIO,
+        *,
+        chunk_size: int = PREFETCH_CHUNK_SIZE,
+        depth: int = PREFETCH_DEPTH,
+    ) -> None:
+        super().__init__()
+        self.bytes_read = 0
+        self._queue: queue.Queue[bytes | BaseException] = queue.Queue(maxsize=depth)
+        self._pending = memoryview(b"")
+        self._eof = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._fill,
+            args=(handle, chunk_size),
+            name="wiktionary-prefetch",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _fill(self, handle: BinaryIO, chunk_size: int) -> None:
+        try:
+            while not self._stop.is_set():
+                chunk = handle.read(chunk_size)
+                self._put(chunk)
+                if not chunk:
+                    return
+        except BaseException as exc:  # re-raised on the consuming thread
+            self._put(exc)
+
+    def _put(self, item: bytes | BaseException) -> None:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:  # type: ignore[override]
+        if not self._pending:
+            if self._eof:
+                return 0
+            item = self._queue.get()
+            if isinstance(item, BaseException):
+                raise item
+            if not item:
+                self._eof = True
+                return 0
+            self._pending = memoryview(item)
+
+        count = min(len(buffer), len(self._pending))
+        buffer[:count] = self._pending[:count]
+        self._pending = self._pending[count:]
+        self.bytes_read += count
+        return count
+
+    def close(self) -> None:
+        self._stop.set()
+        super().close()
+
+
+def _stream_dump_to_postgres(
+    url: str,
+    conninfo: str,
+    table_name: str,
+    column_name: str,
+    truncate: bool,
+) -> int:
+    """Download, decompress, and COPY the dump in one pass without temp files.
+
+    Three stages run concurrently: a prefetch thread reads from the network,
+    the calling thread decompresses and frames rows, and psycopg's queued COPY
+    writer sends them to the server.
+    """
+
+    try:
+        with urllib.request.urlopen(url) as response:
+            total_size = int(response.headers.get("Content-Length", "0") or 0)
+            with _PrefetchingReader(response) as reader:  # type: ignore[arg-type]
+                with GzipFile(fileobj=reader, mode="rb") as stream:
+                    return copy_stream_to_postgres(
+                        stream,  # type: ignore[arg-type]
+                        conninfo,
+                        table_name,
+                        column_name,
+                        truncate,
+                        total_bytes=total_size,
+                        position=lambda: reader.bytes_read,
+                    )
+    except urllib.error.URLError as exc:  # pragma: no cover - network failure guard
+        raise RuntimeError(f"Failed to stream {url}: {exc}") from exc
 
 
 def run_pipeline(
@@ -28,8 +146,70 @@ def run_pipeline(
     table_prefix: str = "dictionary_lang",
     target_schema: str | None = None,
     drop_existing_partitions: bool = False,
+    fused: bool = False,
 ) -> None:
-    """Execute the full download → extract → load → partition workflow."""
+    """Execute the full download → extract → load → partition workflow.
+
+    With ``fused=True`` the dump is streamed from ``url`` through the gzip
+    decoder straight into ``COPY``, skipping the archive and JSONL files on
+    disk. The staged default keeps those files around for debugging and reruns.
+    """
+
+    if fused:
+        print(
+            f"Streaming {url} directly into {table_name}.{column_name}...",
+            file=sys.stderr,
+        )
+        rows_copied = _stream_dump_to_postgres(
+            url, conninfo, table_name, column_name, truncate
+        )
+    else:
+        rows_copied = _run_staged_load(
+            workdir=workdir,
+            conninfo=conninfo,
+            table_name=table_name,
+            column_name=column_name,
+            url=url,
+            truncate=truncate,
+            skip_download=skip_download,
+            skip_extract=skip_extract,
+            overwrite_download=overwrite_download,
+            overwrite_extract=overwrite_extract,
+        )
+    print(
+        f"Finished loading {rows_copied:,} rows into {table_name}.{column_name}",
+        file=sys.stderr,
+    )
+
+    if skip_partition:
+        print("Partition step skipped by configuration.", file=sys.stderr)
+        return
+
+    partition_dictionary_by_language(
+        conninfo,
+        source_table=table_name,
+        column_name=column_name,
+        lang_field=lang_field,
+        table_prefix=table_prefix,
+        target_schema=target_schema,
+        drop_existing=drop_existing_partitions,
+    )
+
+
+def _run_staged_load(
+    *,
+    workdir: Path,
+    conninfo: str,
+    table_name: str,
+    column_name: str,
+    url: str,
+    truncate: bool,
+    skip_download: bool,
+    skip_extract: bool,
+    overwrite_download: bool,
+    overwrite_extract: bool,
+) -> int:
+    """Download and extract to ``workdir``, then COPY the JSONL file."""
 
     workdir = Path(workdir)
     workdir.mkdir(parents=True, exist_ok=True)
@@ -71,31 +251,13 @@ def run_pipeline(
     if not jsonl_path.exists():
         raise FileNotFoundError(f"Expected JSONL file {jsonl_path} after extract step")
 
-    rows_copied = copy_jsonl_to_postgres(
+    return copy_jsonl_to_postgres(
         jsonl_path=jsonl_path,
         conninfo=conninfo,
         table_name=table_name,
         column_name=column_name,
         truncate=truncate,
     )
-    print(
-        f"Finished loading {rows_copied:,} rows into {table_name}.{column_name}",
-        file=sys.stderr,
-    )
-
-    if skip_partition:
-        print("Partition step skipped by configuration.", file=sys.stderr)
-        return
-
-    partition_dictionary_by_language(
-        conninfo,
-        source_table=table_name,
-        column_name=column_name,
-        lang_field=lang_field,
-        table_prefix=table_prefix,
-        target_schema=target_schema,
-        drop_existing=drop_existing_partitions,
-    )
 
 
 __all__ = ["run_pipeline"]
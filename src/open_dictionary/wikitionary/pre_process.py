@@ -1,18 +1,30 @@
 from __future__ import annotations
 
-import json
+import multiprocessing
+import os
 import time
-from typing import Any, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing, nullcontext
+from itertools import batched
+from typing import Any, ContextManager, Iterable, Iterator, Sequence
 
+import orjson
 from psycopg import sql
 from psycopg.cursor import Cursor
 
 from open_dictionary.db.access import DatabaseAccess
+from open_dictionary.utils.prefetch import prefetch
 
 FETCH_BATCH_SIZE = 5000
 UPDATE_BATCH_SIZE = 5000
 PROGRESS_EVERY_ROWS = 20_000
 PROGRESS_EVERY_SECONDS = 30.0
+DEFAULT_WORKERS = os.cpu_count() or 1
+# Tasks per worker for each fetched batch; a few per worker keeps the pool
+# busy when some chunks parse slower than others.
+CHUNKS_PER_WORKER = 4
+# Fetched batches buffered ahead of the processing/writing thread.
+PREFETCH_BATCHES = 2
 
 _ALLOWED_TOP_LEVEL_KEYS = (
     "pos",
@@ -22,6 +34,10 @@ _ALLOWED_TOP_LEVEL_KEYS = (
     "etymology_text",
 )
 _SENSE_KEYS = ("glosses", "raw_glosses")
+_PROJECTED_KEYS = (*_ALLOWED_TOP_LEVEL_KEYS, "senses", "sounds", "related")
+# Per-session staging table; rows vanish at each commit, so every batch
+# starts from an empty table.
+_STAGING_TABLE = "pre_process_batch"
 
 
 def preprocess_entries(
@@ -34,13 +50,22 @@ def preprocess_entries(
     progress_every_rows: int = PROGRESS_EVERY_ROWS,
     progress_every_seconds: float = PROGRESS_EVERY_SECONDS,
     recompute_existing: bool = False,
+    workers: int = DEFAULT_WORKERS,
 ) -> None:
-    """Normalize Wiktionary payloads into a slimmer JSONB column."""
+    """Normalize Wiktionary payloads into a slimmer JSONB column.
+
+    Parsing and trimming run in ``workers`` processes (in-process when 1);
+    results come back in order and a single writer applies them. Rows are
+    fetched on a background thread so the next batch streams in while the
+    current one is processed and committed.
+    """
 
     if fetch_batch_size <= 0:
         raise ValueError("fetch_batch_size must be positive")
     if update_batch_size <= 0:
         raise ValueError("update_batch_size must be positive")
+    if workers <= 0:
+        raise ValueError("workers must be positive")
 
     data_access = DatabaseAccess()
     _ensure_target_column(data_access, table_name, target_column)
@@ -56,7 +81,7 @@ def preprocess_entries(
         f"table={table_name} source={source_column} target={target_column} "
         f"fetch_batch={fetch_batch_size} update_batch={update_batch_size} "
         f"progress_rows={progress_every_rows} progress_seconds={progress_every_seconds} "
-        f"recompute_existing={recompute_existing}",
+        f"recompute_existing={recompute_existing} workers={workers}",
         flush=True,
     )
 
@@ -69,63 +94,69 @@ def preprocess_entries(
 
     with data_access.get_connection() as update_conn:
         with update_conn.cursor() as cursor:
+            _create_staging_table(cursor)
+            update_conn.commit()
+
             row_stream = data_access.iterate_table(
                 table_name,
                 batch_size=fetch_batch_size,
                 columns=(
                     "id",
-                    source_column,
-                    target_column,
+                    (source_column, _projected_payload_sql(source_column)),
                 ),
                 where=where_clause,
                 order_by=("id",),
             )
 
-            for row in row_stream:
-                row_id = row.get("id")
-                if row_id is None:
-                    skipped += 1
-                    continue
-
-                payload = _load_payload(row.get(source_column))
-                if payload is None:
-                    skipped += 1
-                    continue
-
-                processed_payload = _preprocess_payload(payload)
-                payload_json = json.dumps(
-                    processed_payload,
-                    ensure_ascii=False,
-                    separators=(",", ":"),
-                )
+            fetched_batches = prefetch(
+                _owned_batches(row_stream, fetch_batch_size),
+                depth=PREFETCH_BATCHES,
+                name="pre-process-fetch",
+            )
 
-                pending_updates.append((int(row_id), payload_json))
-
-                if len(pending_updates) >= update_batch_size:
-                    batch_count = _flush_updates(
-                        cursor,
-                        table_name,
-                        target_column,
-                        pending_updates,
-                    )
-                    update_conn.commit()
-                    updated += batch_count
-                    pending_updates.clear()
-
-                processed += 1
-
-                emit_progress = False
-                now = time.monotonic()
-                if processed == 1:
-                    emit_progress = True
-                elif progress_every_rows and processed % progress_every_rows == 0:
-                    emit_progress = True
-                elif progress_every_seconds and (now - last_log_time) >= progress_every_seconds:
-                    emit_progress = True
-
-                if emit_progress:
-                    _report_progress(processed, updated, skipped, start_time)
-                    last_log_time = now
+            chunk_size = max(1, fetch_batch_size // (workers * CHUNKS_PER_WORKER))
+
+            with closing(fetched_batches), _worker_pool(workers) as executor:
+                for rows in fetched_batches:
+                    items = [(row.get("id"), row.get(source_column)) for row in rows]
+                    if executor is None:
+                        results = map(_process_row, items)
+                    else:
+                        results = executor.map(
+                            _process_row, items, chunksize=chunk_size
+                        )
+
+                    for result in results:
+                        if result is None:
+                            skipped += 1
+                            continue
+
+                        pending_updates.append(result)
+
+                        if len(pending_updates) >= update_batch_size:
+                            batch_count = _flush_updates(
+                                cursor,
+                                table_name,
+                                target_column,
+                                pending_updates,
+                            )
+                            updated += batch_count
+                            pending_updates.clear()
+
+                        processed += 1
+
+                        emit_progress = False
+                        now = time.monotonic()
+                        if processed == 1:
+                            emit_progress = True
+                        elif progress_every_rows and processed % progress_every_rows == 0:
+                            emit_progress = True
+                        elif progress_every_seconds and (now - last_log_time) >= progress_every_seconds:
+                            emit_progress = True
+
+                        if emit_progress:
+                            _report_progress(processed, updated, skipped, start_time)
+                            last_log_time = now
 
             if pending_updates:
                 batch_count = _flush_updates(
@@ -134,13 +165,69 @@ def preprocess_entries(
                     target_column,
                     pending_updates,
                 )
-                update_conn.commit()
                 updated += batch_count
                 pending_updates.clear()
 
     _report_completion(processed, updated, skipped, start_time)
 
 
+def _projected_payload_sql(source_column: str) -> sql.Composable:
+    """Select only the keys ``_preprocess_payload`` reads, as JSON text.
+
+    Wiktionary entries carry large fields (translations, inflection tables,
+    ...) that are dropped anyway; projecting server-side means they are never
+    sent over the wire or parsed. Non-object payloads map to NULL and are
+    skipped like before.
+    """
+    column = sql.Identifier(source_column)
+    pairs = sql.SQL(", ").join(
+        sql.SQL("{key}, {column} -> {key}").format(key=sql.Literal(key), column=column)
+        for key in _PROJECTED_KEYS
+    )
+    return sql.SQL(
+        "CASE WHEN jsonb_typeof({column}) = 'object' "
+        "THEN jsonb_build_object({pairs})::text END"
+    ).format(column=column, pairs=pairs)
+
+
+def _owned_batches(
+    rows: Iterator[dict[str, Any]], size: int
+) -> Iterator[tuple[dict[str, Any], ...]]:
+    # batched() has no close(), so wrap it in a generator that closes the row
+    # stream (and its server-side cursor) when the batches are abandoned.
+    with closing(rows):
+        yield from batched(rows, size)
+
+
+def _worker_pool(workers: int) -> ContextManager[ProcessPoolExecutor | None]:
+    if workers == 1:
+        return nullcontext()
+    # Workers must not be forked from this process: the prefetch thread holds
+    # an open connection, and a forked child could inherit a held lock.
+    start_method = (
+        "forkserver"
+        if "forkserver" in multiprocessing.get_all_start_methods()
+        else "spawn"
+    )
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context(start_method),
+    )
+
+
+def _process_row(row: tuple[Any, Any]) -> tuple[int, str] | None:
+    row_id, raw_payload = row
+    if row_id is None:
+        return None
+
+    payload = _load_payload(raw_payload)
+    if payload is None:
+        return None
+
+    processed_payload = _preprocess_payload(payload)
+    return int(row_id), orjson.dumps(processed_payload).decode("utf-8")
+
+
 def _ensure_target_column(
     data_access: DatabaseAccess,
     table_name: str,
@@ -162,48 +249,66 @@ def _ensure_target_column(
         conn.commit()
 
 
+def _create_staging_table(cursor: Cursor[Any]) -> None:
+    cursor.execute(
+        sql.SQL(
+            """
+            CREATE TEMP TABLE IF NOT EXISTS {staging} (
+                id BIGINT PRIMARY KEY,
+                payload JSONB
+            ) ON COMMIT DELETE ROWS
+            """
+        ).format(staging=sql.Identifier(_STAGING_TABLE))
+    )
+
+
 def _flush_updates(
     cursor: Cursor[Any],
     table_name: str,
     target_column: str,
     payloads: Sequence[tuple[int, str]],
 ) -> int:
+    """Apply ``payloads`` to ``table_name`` and commit the batch."""
     if not payloads:
         return 0
 
-    values_sql = sql.SQL(", ").join(
-        sql.SQL("(%s::bigint, %s::text)") for _ in payloads
+    copy_sql = sql.SQL("COPY {staging} (id, payload) FROM STDIN").format(
+        staging=sql.Identifier(_STAGING_TABLE)
     )
+    with cursor.copy(copy_sql) as copy:
+        for row in payloads:
+            copy.write_row(row)
 
     update_sql = sql.SQL(
         """
         UPDATE {table} AS t
-        SET {column} = v.payload::jsonb
-        FROM (VALUES {values}) AS v(id, payload)
-        WHERE t.id = v.id
+        SET {column} = s.payload
+        FROM {staging} AS s
+        WHERE t.id = s.id
         """
     ).format(
         table=sql.Identifier(table_name),
         column=sql.Identifier(target_column),
-        values=values_sql,
+        staging=sql.Identifier(_STAGING_TABLE),
     )
 
-    params: list[Any] = []
-    for row_id, payload_json in payloads:
-        params.extend((row_id, payload_json))
-
-    cursor.execute(update_sql, params)
+    # COPY cannot run in pipeline mode, but the UPDATE and COMMIT can be sent
+    # back to back, saving a round-trip per batch. ``prepare=True`` keeps the
+    # UPDATE server-prepared across batches.
+    connection = cursor.connection
+    with connection.pipeline():
+        cursor.execute(update_sql, prepare=True)
+        connection.commit()
     return cursor.rowcount
 
 
 def _preprocess_payload(payload: dict[str, Any]) -> dict[str, Any]:
-    result: dict[str, Any] = {}
-
-    for key in _ALLOWED_TOP_LEVEL_KEYS:
-        if key in payload:
-            value = payload[key]
-            if value is not None:
-                result[key] = value
+    # One hashed lookup per allowed key; key order stays deterministic.
+    result: dict[str, Any] = {
+        key: value
+        for key in _ALLOWED_TOP_LEVEL_KEYS
+        if (value := payload.get(key)) is not None
+    }
 
     senses = _extract_senses(payload.get("senses"))
     if senses is not None:
@@ -229,11 +334,11 @@ def _extract_senses(value: Any) -> list[dict[str, list[str]]] | None:
         if not isinstance(item, dict):
             continue
 
-        sense: dict[str, list[str]] = {}
-        for key in _SENSE_KEYS:
-            normalized = _ensure_string_list(item.get(key))
-            if normalized is not None:
-                sense[key] = normalized
+        sense = {
+            key: normalized
+            for key in _SENSE_KEYS
+            if (normalized := _ensure_string_list(item.get(key))) is not None
+        }
 
         if sense:
             senses.append(sense)
@@ -247,58 +352,33 @@ def _extract_sounds(value: Any) -> list[str] | None:
     if not isinstance(value, list):
         return None
 
-    urls: list[str] = []
-    seen: set[str] = set()
-    for item in value:
-        if isinstance(item, dict):
-            candidate = item.get("ogg_url")
-        else:
-            candidate = None
-
-        if not isinstance(candidate, str):
-            continue
-
-        trimmed = candidate.strip()
-        if not trimmed or trimmed in seen:
-            continue
-
-        urls.append(trimmed)
-        seen.add(trimmed)
-
-    if not urls:
-        return None
-    return urls
+    candidates = (item.get("ogg_url") for item in value if type(item) is dict)
+    return _dedupe_stripped(candidates)
 
 
 def _extract_related(value: Any) -> list[str] | None:
     if not isinstance(value, list):
         return None
 
-    items: list[str] = []
-    seen: set[str] = set()
-
-    for entry in value:
-        candidate: Any
-        if isinstance(entry, dict):
-            candidate = entry.get("word")
-        elif isinstance(entry, (list, tuple)) and entry:
-            candidate = entry[0]
-        else:
-            candidate = entry
-
-        if not isinstance(candidate, str):
-            continue
-
-        word = candidate.strip()
-        if not word or word in seen:
-            continue
+    candidates = (
+        entry.get("word")
+        if type(entry) is dict
+        else entry[0]
+        if type(entry) in (list, tuple) and entry
+        else entry
+        for entry in value
+    )
+    return _dedupe_stripped(candidates)
 
-        items.append(word)
-        seen.add(word)
 
-    if not items:
-        return None
-    return items
+def _dedupe_stripped(candidates: Iterable[Any]) -> list[str] | None:
+    """Strip string candidates, dropping blanks and repeats (first one wins)."""
+    stripped = (
+        candidate.strip() for candidate in candidates if type(candidate) is str
+    )
+    # dict.fromkeys dedupes in a single pass while preserving order.
+    items = list(dict.fromkeys(item for item in stripped if item))
+    return items or None
 
 
 def _ensure_string_list(value: Any) -> list[str] | None:
@@ -329,24 +409,14 @@ def _ensure_string_list(value: Any) -> list[str] | None:
 def _load_payload(value: Any) -> dict[str, Any] | None:
     if isinstance(value, dict):
         return value
-    if value is None:
+    if not isinstance(value, (bytes, bytearray, memoryview, str)):
         return None
-    if isinstance(value, bytes):
-        try:
-            decoded = value.decode("utf-8")
-        except UnicodeDecodeError:
-            return None
-        return _load_payload(decoded)
-    if isinstance(value, memoryview):
-        return _load_payload(value.tobytes())
-    if isinstance(value, str):
-        try:
-            decoded = json.loads(value)
-        except json.JSONDecodeError:
-            return None
-        if isinstance(decoded, dict):
-            return decoded
+    try:
+        decoded = orjson.loads(value)
+    except orjson.JSONDecodeError:
         return None
+    if isinstance(decoded, dict):
+        return decoded
     return None
 
 
@@ -387,6 +457,7 @@ __all__ = [
     "UPDATE_BATCH_SIZE",
     "PROGRESS_EVERY_ROWS",
     "PROGRESS_EVERY_SECONDS",
+    "DEFAULT_WORKERS",
     "preprocess_entries",
 ]
 
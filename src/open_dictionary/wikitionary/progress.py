@@ -23,6 +23,10 @@ class ByteProgressPrinter:
         self.min_time_step = max(min_time_step, 0.0)
         self._last_report_time = time.monotonic()
         self._last_report_bytes = 0
+        # Thresholds for the next report, so the common no-report path is two
+        # comparisons instead of recomputing increments on every call.
+        self._next_bytes = self.min_bytes_step
+        self._next_time = self._last_report_time + self.min_time_step
 
     def report(self, processed_bytes: int, *, force: bool = False) -> None:
         """Report the number of processed bytes if thresholds are met."""
@@ -31,16 +35,13 @@ class ByteProgressPrinter:
             return
 
         now = time.monotonic()
-        bytes_increment = processed_bytes - self._last_report_bytes
 
-        if not force and processed_bytes < self.total_bytes:
-            if (
-                bytes_increment < self.min_bytes_step
-                and (now - self._last_report_time) < self.min_time_step
-            ):
+        if not force:
+            if processed_bytes < self.total_bytes:
+                if processed_bytes < self._next_bytes and now < self._next_time:
+                    return
+            elif processed_bytes <= self._last_report_bytes:
                 return
-        elif not force and bytes_increment <= 0:
-            return
 
         percent_text = ""
         if self.total_bytes:
@@ -53,6 +54,8 @@ class ByteProgressPrinter:
 
         self._last_report_time = now
         self._last_report_bytes = processed_bytes
+        self._next_bytes = processed_bytes + self.min_bytes_step
+        self._next_time = now + self.min_time_step
 
     def finalize(self, processed_bytes: int) -> None:
         """Ensure a final progress update is displayed when finished."""
@@ -83,6 +86,9 @@ class StreamingProgress:
         self._last_report_time = time.monotonic()
         self._last_report_bytes = 0
         self._last_report_rows = 0
+        self._next_bytes = self.min_bytes_step
+        self._next_rows = self.min_rows_step
+        self._next_time = self._last_report_time + self.min_time_step
 
     def report(self, rows: int, bytes_processed: int, *, force: bool = False) -> None:
         """Emit a progress message when thresholds are crossed."""
@@ -91,20 +97,22 @@ class StreamingProgress:
             return
 
         now = time.monotonic()
-        bytes_increment = bytes_processed - self._last_report_bytes
-        rows_increment = rows - self._last_report_rows
 
         if not force:
             if bytes_processed < self.total_bytes:
                 if (
-                    bytes_increment < self.min_bytes_step
-                    and rows_increment < self.min_rows_step
-                    and (now - self._last_report_time) < self.min_time_step
+                    bytes_processed < self._next_bytes
+                    and rows < self._next_rows
+                    and now < self._next_time
                 ):
                     return
-            else:
-                if bytes_increment <= 0 and rows_increment <= 0:
-                    return
+            elif (
+                bytes_processed <= self._last_report_bytes
+                and rows <= self._last_report_rows
+            ):
+                return
+
+        rows_increment = rows - self._last_report_rows
 
         percent_text = ""
         if self.total_bytes:
@@ -126,6 +134,9 @@ class StreamingProgress:
         self._last_report_time = now
         self._last_report_bytes = bytes_processed
         self._last_report_rows = rows
+        self._next_bytes = bytes_processed + self.min_bytes_step
+        self._next_rows = rows + self.min_rows_step
+        self._next_time = now + self.min_time_step
 
     def finalize(self, rows: int, bytes_processed: int) -> None:
         """Ensure a final progress message is emitted."""
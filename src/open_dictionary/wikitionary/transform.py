@@ -2,26 +2,34 @@
 
 from __future__ import annotations
 
-import json
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Iterator, Sequence
+from typing import BinaryIO, Callable, Iterator, Sequence
 
+import orjson
 import psycopg
 from psycopg import sql
+from psycopg.copy import QueuedLibpqWriter
 
 from .progress import StreamingProgress
 
 
 UTF8_BOM = b"\xef\xbb\xbf"
+COPY_BUFFER_SIZE = 64 * 1024
+PARTITION_WORKERS = 4
+
+_UNSAFE_NAME_CHARS = re.compile(r"[^0-9A-Za-z_]+")
 
 
 class JsonlProcessingError(Exception):
     """Raised when the JSONL input contains invalid JSON content."""
 
 
-def iter_json_lines(file_path: Path) -> Iterator[tuple[str, int]]:
+def iter_json_lines(
+    file_path: Path, *, validate: bool = False
+) -> Iterator[tuple[str, int]]:
     """Yield JSON rows and byte offsets from a JSONL file, skipping blank lines."""
 
     path = Path(file_path)
@@ -29,33 +37,95 @@ def iter_json_lines(file_path: Path) -> Iterator[tuple[str, int]]:
         raise FileNotFoundError(f"No JSONL file found at {path}")
 
     with path.open("rb", buffering=1024 * 1024) as handle:
-        for line_number, raw_line in enumerate(handle, start=1):
-            if not raw_line.strip():
-                continue
+        yield from iter_json_stream(handle, validate=validate)
+
 
-            if line_number == 1 and raw_line.startswith(UTF8_BOM):
-                raw_line = raw_line[len(UTF8_BOM) :]
+def iter_json_stream(
+    handle: BinaryIO,
+    *,
+    position: Callable[[], int] | None = None,
+    validate: bool = False,
+) -> Iterator[tuple[str, int]]:
+    """Yield JSON rows from an open binary stream, skipping blank lines.
+
+    The second item of each pair is ``position()`` (default ``handle.tell()``),
+    used for progress reporting. Rows are only parsed in Python when
+    ``validate`` is set; otherwise they pass through as text and PostgreSQL's
+    JSONB input function rejects malformed rows during ``COPY``.
+    """
 
-            json_bytes = raw_line.rstrip(b"\r\n")
-            if not json_bytes:
-                continue
+    for line_number, json_bytes, offset in _iter_json_bytes(
+        handle, position or handle.tell, validate
+    ):
+        try:
+            json_text = json_bytes.decode("utf-8")
+        except UnicodeDecodeError as exc:  # pragma: no cover - defensive
+            message = f"Invalid UTF-8 sequence on line {line_number}: {exc!s}"
+            raise JsonlProcessingError(message) from exc
 
-            try:
-                json_text = json_bytes.decode("utf-8")
-            except UnicodeDecodeError as exc:  # pragma: no cover - defensive
-                message = f"Invalid UTF-8 sequence on line {line_number}: {exc!s}"
-                raise JsonlProcessingError(message) from exc
+        yield json_text, offset
+
+
+def _iter_json_bytes(
+    handle: BinaryIO,
+    position: Callable[[], int],
+    validate: bool,
+) -> Iterator[tuple[int, bytes, int]]:
+    """Yield ``(line_number, json_bytes, position())`` for non-blank lines."""
+
+    # Line splitting stays in BufferedReader's C readline (a memchr scan);
+    # the loop body only trims the terminator, so each line is copied once.
+    for line_number, raw_line in enumerate(handle, start=1):
+        json_bytes = raw_line.rstrip(b"\r\n")
+
+        if line_number == 1 and json_bytes.startswith(UTF8_BOM):
+            json_bytes = json_bytes[len(UTF8_BOM) :]
+
+        if not json_bytes or json_bytes.isspace():
+            continue
 
+        if validate:
             try:
-                json.loads(json_text)
-            except json.JSONDecodeError as exc:  # pragma: no cover - defensive
+                orjson.loads(json_bytes)
+            except orjson.JSONDecodeError as exc:  # pragma: no cover - defensive
                 message = (
                     f"Invalid JSON on line {line_number}: {exc.msg} (column {exc.colno})"
                 )
                 raise JsonlProcessingError(message) from exc
 
-            bytes_read = handle.tell()
-            yield json_text, bytes_read
+        yield line_number, json_bytes, position()
+
+
+def _encode_copy_rows(rows: list[bytes]) -> bytes:
+    """Frame ``rows`` as single-column ``COPY ... (FORMAT text)`` data.
+
+    Rows never contain a newline, so escaping the joined buffer is the same as
+    escaping each row; backslash goes first so later escapes are not doubled.
+    """
+
+    data = b"\n".join(rows) + b"\n"
+    data = data.replace(b"\\", b"\\\\")
+    if b"\t" in data:
+        data = data.replace(b"\t", b"\\t")
+    if b"\r" in data:
+        data = data.replace(b"\r", b"\\r")
+    return data
+
+
+def validate_jsonl(file_path: Path) -> int:
+    """Parse every line of ``file_path`` and return the number of JSON rows.
+
+    Raises :class:`JsonlProcessingError` on the first malformed line. Useful
+    as a pre-flight check, since ``COPY`` otherwise only reports bad rows
+    after the load has started.
+    """
+
+    rows = 0
+    for _ in iter_json_lines(file_path, validate=True):
+        rows += 1
+    return rows
+
+
 def _identifier_from_dotted(qualified_name: str) -> sql.Identifier:
     """Return a psycopg identifier from a dotted path like ``schema.table``."""
 
@@ -85,7 +155,7 @@ def _ensure_table_structure(
 
 
 def _sanitize_language_code(code: str) -> str:
-    safe = re.sub(r"[^0-9A-Za-z_]+", "_", code).strip("_")
+    safe = _UNSAFE_NAME_CHARS.sub("_", code).strip("_")
     return safe.lower()
 
 
@@ -99,8 +169,17 @@ def partition_dictionary_by_language(
     target_schema: str | None = None,
     drop_existing: bool = False,
     languages: Sequence[str] | None = None,
+    max_workers: int = PARTITION_WORKERS,
 ) -> list[str]:
-    """Split rows in ``source_table`` into per-language tables based on ``lang_field``."""
+    """Split rows in ``source_table`` into per-language tables based on ``lang_field``.
+
+    Languages write disjoint rows into separate tables, so up to
+    ``max_workers`` of them are copied concurrently, each on its own
+    connection.
+    """
+
+    if max_workers <= 0:
+        raise ValueError("max_workers must be positive")
 
     created_tables: list[str] = []
     table_identifier = _identifier_from_dotted(source_table)
@@ -125,91 +204,162 @@ def partition_dictionary_by_language(
                 cursor.execute(select_distinct, (lang_field, lang_field, lang_field, lang_field))
                 language_codes = [row[0] for row in cursor.fetchall() if row and row[0]]
 
-            if not language_codes:
-                print(
-                    "No language codes found; skipping partition step.",
-                    file=sys.stderr,
-                )
-                return created_tables
-
-            total_languages = len(language_codes)
+    if not language_codes:
+        print(
+            "No language codes found; skipping partition step.",
+            file=sys.stderr,
+        )
+        return created_tables
+
+    total_languages = len(language_codes)
+    print(
+        f"Partitioning {total_languages} language set(s) from {source_table}.{column_name}...",
+        file=sys.stderr,
+    )
+
+    planned: list[tuple[str, str, sql.Identifier, str]] = []
+    seen_tables: set[tuple[str | None, str]] = set()
+    for idx, code in enumerate(language_codes, start=1):
+        prefix = f"[{idx}/{total_languages}] "
+        safe_code = _sanitize_language_code(code)
+        if not safe_code:
+            print(
+                prefix
+                + f"Skipping language code '{code}' because it cannot form a valid table name.",
+                file=sys.stderr,
+            )
+            continue
+
+        table_name = f"{table_prefix}_{safe_code}"
+        if target_schema:
+            table_key = (target_schema, table_name)
+            target_identifier = sql.Identifier(target_schema, table_name)
+            display_name = f"{target_schema}.{table_name}"
+        else:
+            table_key = (None, table_name)
+            target_identifier = sql.Identifier(table_name)
+            display_name = table_name
+
+        if table_key in seen_tables:
             print(
-                f"Partitioning {total_languages} language set(s) from {source_table}.{column_name}...",
+                prefix
+                + f"Skipping language code '{code}' because it maps to an existing table name {display_name}.",
+                file=sys.stderr,
+            )
+            continue
+        seen_tables.add(table_key)
+        planned.append((prefix, code, target_identifier, display_name))
+
+    if len(planned) > 1:
+        # One index build replaces a full scan of the source per language.
+        _ensure_language_index(conninfo, source_table, column_name, lang_field)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                _partition_language,
+                conninfo,
+                code=code,
+                target_identifier=target_identifier,
+                source_identifier=table_identifier,
+                column_identifier=column_identifier,
+                lang_field=lang_field,
+                drop_existing=drop_existing,
+            ): (prefix, code, display_name)
+            for prefix, code, target_identifier, display_name in planned
+        }
+        for future in as_completed(futures):
+            prefix, code, display_name = futures[future]
+            inserted = future.result()
+            inserted_text = f" ({inserted} rows)" if inserted is not None else ""
+            print(
+                f"{prefix}Partitioned '{code}' -> {display_name}{inserted_text}",
                 file=sys.stderr,
             )
 
-            seen_tables: set[tuple[str | None, str]] = set()
-            for idx, code in enumerate(language_codes, start=1):
-                prefix = f"[{idx}/{total_languages}] "
-                safe_code = _sanitize_language_code(code)
-                if not safe_code:
-                    print(
-                        prefix
-                        + f"Skipping language code '{code}' because it cannot form a valid table name.",
-                        file=sys.stderr,
-                    )
-                    continue
-
-                table_name = f"{table_prefix}_{safe_code}"
-                if target_schema:
-                    table_key = (target_schema, table_name)
-                    target_identifier = sql.Identifier(target_schema, table_name)
-                    display_name = f"{target_schema}.{table_name}"
-                else:
-                    table_key = (None, table_name)
-                    target_identifier = sql.Identifier(table_name)
-                    display_name = table_name
-
-                if table_key in seen_tables:
-                    print(
-                        prefix
-                        + f"Skipping language code '{code}' because it maps to an existing table name {display_name}.",
-                        file=sys.stderr,
-                    )
-                    continue
-                seen_tables.add(table_key)
-
-                if drop_existing:
-                    drop_sql = sql.SQL("DROP TABLE IF EXISTS {}").format(target_identifier)
-                    cursor.execute(drop_sql)
-                    connection.commit()
-
-                create_sql = sql.SQL(
-                    """
-                    CREATE TABLE IF NOT EXISTS {} (
-                        id BIGINT PRIMARY KEY,
-                        {} JSONB NOT NULL
-                    )
-                    """
-                ).format(target_identifier, column_identifier)
-                cursor.execute(create_sql)
+    created_tables.extend(display_name for _, _, _, display_name in planned)
+    return created_tables
 
-                insert_sql = sql.SQL(
-                    """
-                    INSERT INTO {target} (id, {column})
-                    SELECT id, {column}
-                    FROM {source}
-                    WHERE {column}->>%s = %s
-                    ON CONFLICT (id) DO NOTHING
-                    """
-                ).format(
-                    target=target_identifier,
-                    column=column_identifier,
-                    source=table_identifier,
-                )
 
-                cursor.execute(insert_sql, (lang_field, code))
+def _ensure_language_index(
+    conninfo: str,
+    source_table: str,
+    column_name: str,
+    lang_field: str,
+) -> None:
+    """Index ``column->>lang_field`` on the source table and refresh its stats.
+
+    The key is inlined as a literal (here and in the per-language INSERT) so
+    the planner can match the expression index.
+    """
+
+    table_identifier = _identifier_from_dotted(source_table)
+    base_name = source_table.rsplit(".", 1)[-1]
+    index_name = _sanitize_language_code(f"{base_name}_{column_name}_{lang_field}_idx")
+
+    create_index = sql.SQL(
+        "CREATE INDEX IF NOT EXISTS {index} ON {table} (({column}->>{field}))"
+    ).format(
+        index=sql.Identifier(index_name[:63]),
+        table=table_identifier,
+        column=sql.Identifier(column_name),
+        field=sql.Literal(lang_field),
+    )
+
+    print(f"Ensuring index {index_name[:63]} on {source_table}...", file=sys.stderr)
+    with psycopg.connect(conninfo, autocommit=True) as connection:
+        connection.execute(create_index)
+        connection.execute(sql.SQL("ANALYZE {}").format(table_identifier))
+
+
+def _partition_language(
+    conninfo: str,
+    *,
+    code: str,
+    target_identifier: sql.Identifier,
+    source_identifier: sql.Identifier,
+    column_identifier: sql.Identifier,
+    lang_field: str,
+    drop_existing: bool,
+) -> int | None:
+    """Create and fill the table for one language; return the inserted row count."""
+
+    with psycopg.connect(conninfo) as connection:
+        with connection.cursor() as cursor:
+            if drop_existing:
+                drop_sql = sql.SQL("DROP TABLE IF EXISTS {}").format(target_identifier)
+                cursor.execute(drop_sql)
                 connection.commit()
 
-                inserted = cursor.rowcount if cursor.rowcount != -1 else None
-                inserted_text = f" ({inserted} rows)" if inserted is not None else ""
-                print(
-                    f"{prefix}Partitioned '{code}' -> {display_name}{inserted_text}",
-                    file=sys.stderr,
+            create_sql = sql.SQL(
+                """
+                CREATE TABLE IF NOT EXISTS {} (
+                    id BIGINT PRIMARY KEY,
+                    {} JSONB NOT NULL
                 )
-                created_tables.append(display_name)
+                """
+            ).format(target_identifier, column_identifier)
+            cursor.execute(create_sql)
+
+            insert_sql = sql.SQL(
+                """
+                INSERT INTO {target} (id, {column})
+                SELECT id, {column}
+                FROM {source}
+                WHERE {column}->>{field} = %s
+                ON CONFLICT (id) DO NOTHING
+                """
+            ).format(
+                target=target_identifier,
+                column=column_identifier,
+                source=source_identifier,
+                field=sql.Literal(lang_field),
+            )
 
-    return created_tables
+            cursor.execute(insert_sql, (code,))
+            connection.commit()
+
+            return cursor.rowcount if cursor.rowcount != -1 else None
 
 
 def copy_jsonl_to_postgres(
@@ -218,12 +368,46 @@ def copy_jsonl_to_postgres(
     table_name: str,
     column_name: str,
     truncate: bool = False,
+    *,
+    validate: bool = False,
 ) -> int:
     """Stream JSON rows from ``jsonl_path`` into ``table_name.column_name``.
 
     Returns the number of rows copied.
     """
 
+    total_bytes = jsonl_path.stat().st_size
+
+    with jsonl_path.open("rb", buffering=1024 * 1024) as handle:
+        return copy_stream_to_postgres(
+            handle,
+            conninfo,
+            table_name,
+            column_name,
+            truncate,
+            total_bytes=total_bytes,
+            validate=validate,
+        )
+
+
+def copy_stream_to_postgres(
+    stream: BinaryIO,
+    conninfo: str,
+    table_name: str,
+    column_name: str,
+    truncate: bool = False,
+    *,
+    total_bytes: int = 0,
+    position: Callable[[], int] | None = None,
+    validate: bool = False,
+) -> int:
+    """Stream JSON lines from an open binary ``stream`` into ``table_name.column_name``.
+
+    ``total_bytes`` and ``position`` drive progress output and ``validate``
+    enables Python-side JSON parsing; see :func:`iter_json_stream`. Returns
+    the number of rows copied.
+    """
+
     table_identifier = _identifier_from_dotted(table_name)
     if not column_name.strip():
         raise ValueError("Column name cannot be empty")
@@ -231,11 +415,11 @@ def copy_jsonl_to_postgres(
     column_identifier = sql.Identifier(column_name)
 
     rows_written = 0
-    total_bytes = jsonl_path.stat().st_size
     progress = StreamingProgress(total_bytes, label=f"COPY {table_name}")
     latest_bytes_processed = 0
 
-    with psycopg.connect(conninfo) as connection:
+    # Rows are sent as raw UTF-8 bytes, so pin the session encoding to match.
+    with psycopg.connect(conninfo, client_encoding="utf8") as connection:
         with connection.cursor() as cursor:
             _ensure_table_structure(cursor, table_identifier, column_identifier)
 
@@ -248,12 +432,31 @@ def copy_jsonl_to_postgres(
             )
             copy_command = copy_sql.as_string(connection)
 
-            with cursor.copy(copy_command) as copy:  # type: ignore[arg-type]
-                for json_text, bytes_processed in iter_json_lines(jsonl_path):
-                    copy.write_row((json_text,))
+            batch: list[bytes] = []
+            batch_bytes = 0
+
+            # The queued writer ships COPY buffers to the server from a worker
+            # thread, so network writes overlap with reading the next rows.
+            # Rows are escaped and written in ~64 KiB blocks rather than
+            # formatted one by one with write_row().
+            writer = QueuedLibpqWriter(cursor)
+            with cursor.copy(copy_command, writer=writer) as copy:  # type: ignore[arg-type]
+                for _, json_bytes, bytes_processed in _iter_json_bytes(
+                    stream, position or stream.tell, validate
+                ):
+                    batch.append(json_bytes)
+                    batch_bytes += len(json_bytes)
                     rows_written += 1
                     latest_bytes_processed = bytes_processed
-                    progress.report(rows_written, latest_bytes_processed)
+
+                    if batch_bytes >= COPY_BUFFER_SIZE:
+                        copy.write(_encode_copy_rows(batch))
+                        batch.clear()
+                        batch_bytes = 0
+                        progress.report(rows_written, latest_bytes_processed)
+
+                if batch:
+                    copy.write(_encode_copy_rows(batch))
 
     progress.finalize(rows_written, latest_bytes_processed)
 
@@ -262,6 +465,9 @@ def copy_jsonl_to_postgres(
 __all__ = [
     "JsonlProcessingError",
     "iter_json_lines",
+    "iter_json_stream",
+    "validate_jsonl",
     "partition_dictionary_by_language",
     "copy_jsonl_to_postgres",
+    "copy_stream_to_postgres",
 ]
@@ -1,21 +1,71 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any
+from contextlib import closing
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Awaitable, Callable, Iterable, Iterator
+import asyncio
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import signal
 import sys
+import threading
 import time
 
+from openai import AsyncOpenAI
+
 from open_dictionary.db.access import DatabaseAccess
 from open_dictionary.db.sqlite_manager import SQLiteManager
-from open_dictionary.llm.define import define, Definition
-
-# Configure logging
+from open_dictionary.llm.define import define_async, Definition
+from open_dictionary.llm.llm_client import create_async_client
+from open_dictionary.llm.rate_limit import AsyncRateLimiter
+from open_dictionary.utils.prefetch import prefetch
+
+# Configure logging. Records are handed to a queue and written to stderr by a
+# listener thread, so the dispatcher and SQLite writer never block on stderr.
+_log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler(sys.stderr)
+_log_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
+_log_listener = QueueListener(_log_queue, _log_stream_handler)
+_log_queue_handler = QueueHandler(_log_queue)
+# Only merge args/traceback into the message here; the listener's handler
+# applies the full format.
+_log_queue_handler.setFormatter(logging.Formatter('%(message)s'))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    stream=sys.stderr
+    handlers=[_log_queue_handler],
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# Signals that stop dispatching new words while letting in-flight ones land.
+_SHUTDOWN_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+# (word, definition serialized as JSON text)
+DefinitionResult = tuple[str, str]
+
+# Lower bound on rows per server-side cursor round-trip; small SQLite batch
+# sizes should not translate into chatty PostgreSQL fetches.
+MIN_FETCH_SIZE = 1000
+
+# Rows buffered ahead of the dispatcher, per worker.
+ROW_PREFETCH_FACTOR = 4
+
+# Definitions per SQLite transaction unless a larger batch_size is given;
+# thousands of rows per commit still fit comfortably in the page cache.
+MIN_COMMIT_SIZE = 1000
+
+# Longest a completed definition waits before its group is committed.
+COMMIT_INTERVAL_SECONDS = 5.0
+
+# Completed definitions allowed to queue up behind the SQLite writer thread.
+WRITE_QUEUE_DEPTH = 10_000
+
+_FLUSH_DUE = object()
+
 
 class ProgressReporter:
     """Report progress of definition generation with statistics."""
@@ -80,47 +130,286 @@ class ProgressReporter:
         logger.info("=" * 60)
 
 
-def process_single_word(word_data: dict[str, Any]) -> tuple[str, dict[str, Any]] | None:
+class SQLiteBatchWriter:
+    """Write definitions to SQLite in commit groups on a dedicated thread.
+
+    The dispatcher hands each definition over with :meth:`add` and goes
+    straight back to submitting LLM requests. The writer commits once
+    ``commit_size`` definitions have accumulated or the oldest one has waited
+    ``commit_interval`` seconds, whichever comes first. A write failure is
+    re-raised on the next :meth:`add` or on :meth:`close`.
+    """
+
+    def __init__(
+        self,
+        sqlite_manager: SQLiteManager,
+        *,
+        commit_size: int = MIN_COMMIT_SIZE,
+        commit_interval: float = COMMIT_INTERVAL_SECONDS,
+        max_pending: int = WRITE_QUEUE_DEPTH,
+        replace_existing: bool = True,
+    ):
+        if commit_size <= 0:
+            raise ValueError("commit_size must be positive")
+
+        self._sqlite_manager = sqlite_manager
+        self._commit_size = commit_size
+        self._replace_existing = replace_existing
+        self._commit_interval = max(commit_interval, 0.0)
+        self._queue: queue.Queue[DefinitionResult | None] = queue.Queue(
+            maxsize=max_pending
+        )
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(
+            target=self._run,
+            name="sqlite-writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        batch: list[DefinitionResult] = []
+        deadline: float | None = None
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = _FLUSH_DUE
+
+            if item is None:
+                self._write(batch)
+                return
+            if item is not _FLUSH_DUE:
+                batch.append(item)  # type: ignore[arg-type]
+                if deadline is None:
+                    deadline = time.monotonic() + self._commit_interval
+
+            if len(batch) >= self._commit_size or (
+                deadline is not None and time.monotonic() >= deadline
+            ):
+                self._write(batch)
+                batch = []
+                deadline = None
+
+    def _write(self, batch: list[DefinitionResult]) -> None:
+        if not batch or self._error is not None:
+            # After a failure keep draining so the dispatcher never blocks on
+            # a dead writer.
+            return
+        try:
+            self._sqlite_manager.insert_definitions_batch(
+                batch,
+                replace=self._replace_existing,
+            )
+            logger.info(f"Wrote batch of {len(batch)} to SQLite. Total in DB: {self._sqlite_manager.cached_count()}")
+        except BaseException as exc:
+            self._error = exc
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise RuntimeError("SQLite writer failed") from self._error
+
+    async def add(self, word: str, definition: str) -> None:
+        """Queue one definition for writing without blocking the event loop.
+
+        If the queue is full the put waits on a worker thread, so a slow disk
+        holds back only the task handing over the result.
+        """
+        self._raise_if_failed()
+        item = (word, definition)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            await asyncio.to_thread(self._queue.put, item)
+
+    def close(self) -> None:
+        """Commit everything queued and stop the writer thread."""
+        self._queue.put(None)
+        self._thread.join()
+        self._raise_if_failed()
+
+
+async def process_single_word_async(
+    word_data: dict[str, Any],
+    *,
+    client: AsyncOpenAI,
+    limiter: AsyncRateLimiter | None = None,
+) -> DefinitionResult | None:
     """Process a single word definition request.
 
     Args:
         word_data: Dictionary containing word data from PostgreSQL
+        client: Async LLM client shared by all in-flight requests
+        limiter: Optional rate limiter acquired before the LLM request
 
     Returns:
-        Tuple of (word, definition_dict) or None if processing failed
+        Tuple of (word, definition_json) or None if processing failed
     """
     try:
-        logger.debug(f"Processing word data keys: {list(word_data.keys())}")
-        definition = define(word_data)
-        result = (definition.word, definition.model_dump())
-        logger.debug(f"Successfully processed word: {definition.word}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processing word data keys: %s", list(word_data.keys()))
+        definition = await define_async(word_data, client=client, limiter=limiter)
+        result = (definition.word, definition.model_dump_json())
+        logger.debug("Successfully processed word: %s", definition.word)
         return result
     except Exception as e:
         logger.error(f"Failed to process word '{word_data.get('word', 'unknown')}': {e}", exc_info=True)
         return None
 
 
+_get_data = itemgetter('data')
+
+
+def _iter_word_data(
+    rows: Iterable[dict[str, Any]],
+    limit: int | None,
+    *,
+    known_words: set[str] | None = None,
+) -> Iterator[Any]:
+    """Unwrap each row's payload, stopping after ``limit`` rows when given.
+
+    Payloads whose word is in ``known_words`` are dropped before they count
+    towards ``limit``.
+    """
+    # Rows are selected with the 'data' column only, so the payload sits at a
+    # fixed key and needs no per-row shape check.
+    word_data = map(_get_data, rows)
+    if known_words:
+        word_data = (
+            item
+            for item in word_data
+            if not (isinstance(item, dict) and item.get('word') in known_words)
+        )
+    if limit:
+        return islice(word_data, limit)
+    return word_data
+
+
+async def _define_concurrently(
+    items: Iterator[Any],
+    *,
+    max_in_flight: int,
+    on_result: Callable[[Any, DefinitionResult | None], Awaitable[None]],
+    requests_per_minute: float | None = None,
+) -> bool:
+    """Define every item in ``items`` with at most ``max_in_flight`` requests open.
+
+    Requests run as tasks on one event loop sharing a single async client, so
+    concurrency is not tied to a thread per request. ``items`` may block (it
+    is fed from PostgreSQL) and is therefore advanced off the loop.
+    ``on_result`` is awaited on the loop thread as each request finishes.
+    ``requests_per_minute`` additionally caps the request rate with a token
+    bucket so the provider's RPM limit is not exceeded.
+
+    The first SIGINT/SIGTERM stops new submissions and lets in-flight requests
+    finish so their results are still recorded; a second SIGINT interrupts
+    immediately.
+
+    Returns:
+        True if the run was stopped by a signal before ``items`` ran out
+    """
+    semaphore = asyncio.Semaphore(max_in_flight)
+    limiter = (
+        AsyncRateLimiter(requests_per_minute) if requests_per_minute else None
+    )
+    exhausted = object()
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    def _request_stop(sig: signal.Signals) -> None:
+        logger.warning(
+            f"Received {sig.name}; finishing in-flight requests before exiting "
+            "(press Ctrl+C again to abort)"
+        )
+        stop.set()
+        for handled in _SHUTDOWN_SIGNALS:
+            loop.remove_signal_handler(handled)
+
+    installed = []
+    for sig in _SHUTDOWN_SIGNALS:
+        try:
+            loop.add_signal_handler(sig, _request_stop, sig)
+        except (NotImplementedError, RuntimeError):
+            # Unsupported platform or not on the main thread.
+            continue
+        installed.append(sig)
+
+    try:
+        async with create_async_client() as client:
+
+            async def _run(word_data: Any) -> None:
+                try:
+                    result = await process_single_word_async(
+                        word_data,
+                        client=client,
+                        limiter=limiter,
+                    )
+                finally:
+                    semaphore.release()
+                await on_result(word_data, result)
+
+            async with asyncio.TaskGroup() as tasks:
+                while not stop.is_set():
+                    await semaphore.acquire()
+                    if stop.is_set():
+                        semaphore.release()
+                        break
+                    word_data = await asyncio.to_thread(next, items, exhausted)
+                    if word_data is exhausted:
+                        semaphore.release()
+                        break
+                    tasks.create_task(_run(word_data))
+    finally:
+        if not stop.is_set():
+            for sig in installed:
+                loop.remove_signal_handler(sig)
+
+    return stop.is_set()
+
+
 def run_parallel_definitions(
     table_name: str = "dictionary_en",
     batch_size: int = 50,
     max_workers: int = 50,
     sqlite_path: str = "data/dictionary.sqlite",
     limit: int | None = None,
+    *,
+    pg_fetch_size: int | None = None,
+    sqlite_commit_size: int | None = None,
+    skip_existing: bool = True,
+    requests_per_minute: float | None = None,
 ):
     """Process dictionary entries in parallel and store in SQLite.
 
     This function reads from PostgreSQL, sends definition requests to LLM in parallel,
-    and writes results to SQLite.
+    and writes results to SQLite. LLM requests are asyncio tasks sharing one
+    async client rather than one thread each.
 
     Args:
         table_name: Name of the PostgreSQL table to read from
-        batch_size: Number of rows to fetch from PostgreSQL per batch
-        max_workers: Maximum number of parallel LLM requests
+        batch_size: Base batch size; the fetch and commit sizes default to at
+            least this value
+        max_workers: Maximum number of in-flight LLM requests
         sqlite_path: Path to SQLite database file
         limit: Optional limit on number of words to process
+        pg_fetch_size: Rows fetched from PostgreSQL per round-trip
+            (default: ``max(batch_size, 1000)``)
+        sqlite_commit_size: Definitions written per SQLite transaction
+            (default: ``max(batch_size, 1000)``); smaller groups are committed
+            after 5 seconds
+        skip_existing: Skip rows whose word already has a definition in
+            SQLite, so resumed runs do not pay for those LLM calls again
+        requests_per_minute: Optional cap on the LLM request rate
     """
+    if pg_fetch_size is None:
+        pg_fetch_size = max(batch_size, MIN_FETCH_SIZE)
+    if sqlite_commit_size is None:
+        sqlite_commit_size = max(batch_size, MIN_COMMIT_SIZE)
+
     db_access = DatabaseAccess()
     sqlite_manager = SQLiteManager(sqlite_path)
+    initial_count = sqlite_manager.cached_count()
     progress = ProgressReporter()
 
     logger.info(f"Starting parallel definition processing with {max_workers} workers")
@@ -129,95 +418,81 @@ def run_parallel_definitions(
     if limit:
         logger.info(f"Processing limit: {limit:,} words")
 
+    known_words: set[str] | None = None
+    if skip_existing:
+        known_words = sqlite_manager.load_words()
+        if known_words:
+            logger.info(f"Skipping {len(known_words):,} words already in SQLite")
+
     processed_count = 0
     failed_count = 0
-    pending_batch = []
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Iterator to track all submitted futures
-        future_to_word = {}
 
-        # Iterate through PostgreSQL table
-        row_iterator = db_access.iterate_table(
-            table_name=table_name,
-            batch_size=batch_size,
+    async def record_result(
+        word_key: str,
+        result: DefinitionResult | None,
+    ) -> None:
+        nonlocal processed_count, failed_count
+
+        if result:
+            word, definition = result
+            await writer.add(word, definition)
+            processed_count += 1
+            logger.debug("Queued '%s' for SQLite", word)
+        else:
+            failed_count += 1
+            logger.warning("Failed to process: %s", word_key)
+
+        progress.maybe_report(processed_count, failed_count)
+
+    # When existing words are skipped up front, any duplicate reaching the
+    # writer (e.g. two rows for the same word) keeps the first definition.
+    writer = SQLiteBatchWriter(
+        sqlite_manager,
+        commit_size=sqlite_commit_size,
+        replace_existing=not skip_existing,
+    )
+    try:
+        # Iterate through PostgreSQL table on a producer thread so fetch
+        # round-trips overlap with dispatching LLM requests
+        row_iterator = prefetch(
+            db_access.iterate_table(
+                table_name=table_name,
+                batch_size=pg_fetch_size,
+                columns=("data",),
+            ),
+            depth=max_workers * ROW_PREFETCH_FACTOR,
+            name="definition-rows",
         )
 
-        for row in row_iterator:
-            # Check limit
-            if limit and processed_count >= limit:
-                break
-
-            # Extract the data field if present (PostgreSQL stores JSON in 'data' column)
-            word_data = row.get('data', row)
+        async def on_result(word_data: Any, result: DefinitionResult | None) -> None:
             word_key = word_data.get('word', 'unknown') if isinstance(word_data, dict) else 'unknown'
-
-            # Submit word for processing
-            future = executor.submit(process_single_word, word_data)
-            future_to_word[future] = word_key
-
-            # When we have max_workers futures pending, wait for some to complete
-            if len(future_to_word) >= max_workers:
-                # Wait for at least one to complete
-                for future in as_completed(list(future_to_word.keys())):
-                    # Process this completed future and break to continue submitting
-                    if future not in future_to_word:
-                        continue
-
-                    word_key = future_to_word.pop(future)
-                    result = future.result()
-
-                    if result:
-                        word, definition = result
-                        pending_batch.append((word, definition))
-                        processed_count += 1
-                        logger.debug(f"Added '{word}' to pending batch (size: {len(pending_batch)})")
-
-                        # Write batch when it reaches batch_size
-                        if len(pending_batch) >= batch_size:
-                            logger.debug(f"Writing batch of {len(pending_batch)} definitions to SQLite")
-                            sqlite_manager.insert_definitions_batch(pending_batch)
-                            logger.info(f"Wrote batch to SQLite. Total in DB: {sqlite_manager.count_definitions()}")
-                            pending_batch = []
-
-                        # Report progress
-                        progress.maybe_report(processed_count, failed_count)
-                    else:
-                        failed_count += 1
-                        logger.warning(f"Failed to process: {word_key}")
-                        progress.maybe_report(processed_count, failed_count)
-
-                    # Break after processing one to continue submitting more work
-                    break
-
-        # Wait for remaining futures
-        for future in as_completed(future_to_word.keys()):
-            word_key = future_to_word[future]
-            result = future.result()
-
-            if result:
-                word, definition = result
-                pending_batch.append((word, definition))
-                processed_count += 1
-                progress.maybe_report(processed_count, failed_count)
-            else:
-                failed_count += 1
-                logger.warning(f"Failed to process: {word_key}")
-                progress.maybe_report(processed_count, failed_count)
-
-        # Write any remaining definitions
-        if pending_batch:
-            logger.info(f"Writing final batch of {len(pending_batch)} definitions to SQLite")
-            sqlite_manager.insert_definitions_batch(pending_batch)
-            logger.info(f"Final batch written. Total in DB: {sqlite_manager.count_definitions()}")
+            await record_result(word_key, result)
+
+        with closing(row_iterator):
+            interrupted = asyncio.run(
+                _define_concurrently(
+                    _iter_word_data(row_iterator, limit, known_words=known_words),
+                    max_in_flight=max_workers,
+                    on_result=on_result,
+                    requests_per_minute=requests_per_minute,
+                )
+            )
+        if interrupted:
+            logger.warning("Stopped early on signal; re-run to resume with the remaining words")
+    finally:
+        writer.close()
 
     # Final statistics
     progress.finalize(processed_count, failed_count)
     final_count = sqlite_manager.count_definitions()
     logger.info(f"Total definitions in SQLite: {final_count:,}")
 
-    if final_count != processed_count:
-        logger.warning(f"Mismatch: processed {processed_count} but only {final_count} in database!")
+    # Compare against the rows added by this run; resumed runs start from a
+    # non-empty table. When redefining, replaced words add no rows, so the
+    # counts are not expected to match.
+    added_count = final_count - initial_count
+    if skip_existing and added_count != processed_count:
+        logger.warning(f"Mismatch: processed {processed_count} but only {added_count} new rows in database!")
 
 
 if __name__ == "__main__":
@@ -235,7 +510,17 @@ if __name__ == "__main__":
         "--batch-size",
         type=int,
         default=50,
-        help="Number of rows to fetch from PostgreSQL per batch (default: 50).",
+        help="Base batch size; fetch and commit sizes default to at least this (default: 50).",
+    )
+    parser.add_argument(
+        "--pg-fetch-size",
+        type=int,
+        help="Rows to fetch from PostgreSQL per round-trip (default: max(batch size, 1000)).",
+    )
+    parser.add_argument(
+        "--sqlite-commit-size",
+        type=int,
+        help="Definitions to write per SQLite transaction (default: max(batch size, 1000)).",
     )
     parser.add_argument(
         "--workers",
@@ -253,6 +538,16 @@ if __name__ == "__main__":
         type=int,
         help="Optional limit on number of words to process (for testing).",
     )
+    parser.add_argument(
+        "--requests-per-minute",
+        type=float,
+        help="Optional cap on LLM requests per minute (default: unlimited).",
+    )
+    parser.add_argument(
+        "--redefine-existing",
+        action="store_true",
+        help="Also process words that already have a definition in SQLite.",
+    )
 
     args = parser.parse_args()
 
@@ -262,5 +557,9 @@ if __name__ == "__main__":
         max_workers=args.workers,
         sqlite_path=args.sqlite_path,
         limit=args.limit,
+        pg_fetch_size=args.pg_fetch_size,
+        sqlite_commit_size=args.sqlite_commit_size,
+        skip_existing=not args.redefine_existing,
+        requests_per_minute=args.requests_per_minute,
     )
 